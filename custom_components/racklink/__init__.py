@@ -5,10 +5,10 @@ import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import DATA_PENDING_CLIENTS, DEFAULT_PORT, DEFAULT_USERNAME, DOMAIN
 from .coordinator import RackLinkCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -18,8 +18,19 @@ PLATFORMS: list[Platform] = [Platform.SWITCH, Platform.SENSOR]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up RackLink from a config entry."""
-    coordinator = RackLinkCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    # Reuse the connection the config flow just validated, if there is one
+    client = hass.data.get(DATA_PENDING_CLIENTS, {}).pop(
+        (entry.data[CONF_HOST], entry.data[CONF_PORT]), None
+    )
+    coordinator = RackLinkCoordinator(hass, entry, client=client)
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Close the handed-off session; the retry opens its own
+        await coordinator.async_shutdown()
+        raise
+    # Only after a successful first refresh, so a setup retry never leaks a pinger
+    coordinator.async_start_keepalive()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
@@ -28,12 +39,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry."""
+    if entry.version == 1:
+        # Version 1 entries only stored port/username if the user changed them
+        data = {CONF_PORT: DEFAULT_PORT, CONF_USERNAME: DEFAULT_USERNAME, **entry.data}
+        hass.config_entries.async_update_entry(entry, data=data, version=2)
+        _LOGGER.debug("Migrated config entry to version 2")
+
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         coordinator: RackLinkCoordinator = hass.data[DOMAIN][entry.entry_id]
-        await coordinator.client.disconnect()
+        await coordinator.async_shutdown()
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
@@ -8,10 +8,19 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
 
-from .const import DEFAULT_PORT, DEFAULT_USERNAME, DOMAIN, PROTOCOL_PORT
+from .const import (
+    DATA_PENDING_CLIENTS,
+    DEFAULT_PORT,
+    DEFAULT_USERNAME,
+    DOMAIN,
+    PENDING_CLIENT_TIMEOUT,
+    PROTOCOL_PORT,
+)
 from .protocol import RackLinkProtocol
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,10 +35,31 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+@callback
+def _async_hand_off_client(hass: HomeAssistant, client: RackLinkProtocol) -> None:
+    """Keep a validated connection for the entry that is about to be set up."""
+    key = (client.host, client.port)
+    pending: dict[tuple[str, int], RackLinkProtocol] = hass.data.setdefault(
+        DATA_PENDING_CLIENTS, {}
+    )
+    if (stale := pending.pop(key, None)) is not None:
+        hass.async_create_task(stale.disconnect())
+    pending[key] = client
+
+    @callback
+    def _release(_now: Any) -> None:
+        # Setup never claimed it (e.g. it failed); don't hold the session open
+        if pending.get(key) is client:
+            del pending[key]
+            hass.async_create_task(client.disconnect())
+
+    async_call_later(hass, PENDING_CLIENT_TIMEOUT, _release)
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for RackLink."""
 
-    VERSION = 1
+    VERSION = 2
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -41,32 +71,33 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         errors = {}
+        # Fill in the optional fields' defaults so entry.data always has them
+        user_input = STEP_USER_DATA_SCHEMA(user_input)
 
         # Validate connection
-        client = RackLinkProtocol(
-            user_input[CONF_HOST], user_input.get(CONF_PORT, DEFAULT_PORT)
-        )
+        client = RackLinkProtocol(user_input[CONF_HOST], user_input[CONF_PORT])
         try:
             if not await client.connect():
                 errors["base"] = "cannot_connect"
             elif not await client.login(
-                user_input.get(CONF_USERNAME, DEFAULT_USERNAME),
-                user_input[CONF_PASSWORD],
+                user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
             ):
                 errors["base"] = "invalid_auth"
-            else:
-                await client.disconnect()
         except Exception as err:
             _LOGGER.exception("Unexpected exception during config flow: %s", err)
             errors["base"] = "unknown"
         finally:
-            await client.disconnect()
+            # On success the logged-in client is handed to the coordinator;
+            # disconnect() is a no-op for a client that never connected
+            if errors:
+                await client.disconnect()
 
         if errors:
             return self.async_show_form(
                 step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
             )
 
+        _async_hand_off_client(self.hass, client)
         return self.async_create_entry(
             title=f"RackLink {user_input[CONF_HOST]}",
             data=user_input,
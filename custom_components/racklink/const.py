@@ -2,6 +2,11 @@
 from __future__ import annotations
 
 DOMAIN = "racklink"
+# hass.data key for clients authenticated by the config flow, keyed by
+# (host, port), waiting to be picked up by async_setup_entry
+DATA_PENDING_CLIENTS = f"{DOMAIN}_pending_clients"
+# Seconds before an unclaimed config-flow client is disconnected
+PENDING_CLIENT_TIMEOUT = 60
 MANUFACTURER = "Middle Atlantic"
 
 # Protocol constants
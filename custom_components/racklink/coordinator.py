@@ -3,32 +3,98 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Coroutine
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import cached_property
+from typing import Any, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
-from .protocol import RackLinkProtocol
+from .const import DOMAIN, MANUFACTURER
+from .protocol import REQUEST_TIMEOUT, RackLinkProtocol
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True, frozen=True)
+class Outlet:
+    """State and name of one outlet, as last read from the device."""
+
+    state: bool | None
+    name: str
+
+
 UPDATE_INTERVAL = timedelta(seconds=30)
+# Polling backs off to this interval while outlet data stays unchanged
+MAX_UPDATE_INTERVAL = timedelta(seconds=120)
+# Outlet names only change when an administrator renames them
+NAME_REFRESH_INTERVAL = 3600
+KEEPALIVE_INTERVAL = 20
+# Outlet switches within this many seconds of each other share one refresh
+SWITCH_REFRESH_COOLDOWN = 0.3
+# Upper bounds on a connect+login and on each batch of reads, with headroom
+# over the client's own timeouts so those fire first. A connect+login waits
+# for up to three steps (TCP connect, login response, first ping); a batch
+# gets longer than one request, so one slow outlet or sensor times out on
+# its own instead of failing the whole update.
+CONNECT_TIMEOUT = 3 * REQUEST_TIMEOUT + 2
+BATCH_TIMEOUT = REQUEST_TIMEOUT + 2
+# Sensors read by the coordinator: (data key, command register, seconds a
+# reading stays fresh). Slow-moving values are read less often.
+SENSORS: tuple[tuple[str, int, float], ...] = (
+    ("temperature", 0x50, 120),
+    ("voltage", 0x51, 30),
+    ("current", 0x52, 30),
+    ("power", 0x53, 30),
+    ("power_factor", 0x54, 120),
+    ("thermal_load", 0x55, 120),
+    ("occupancy", 0x56, 300),
+)
 
 
 class RackLinkCoordinator(DataUpdateCoordinator):
     """Class to manage fetching RackLink data."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        """Initialize."""
-        self.client = RackLinkProtocol(
-            entry.data["host"],
-            entry.data.get("port", 60000),
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: RackLinkProtocol | None = None,
+    ) -> None:
+        """Initialize.
+
+        An already logged-in ``client`` may be passed in to skip the initial
+        connect and login.
+        """
+        self.client = client or RackLinkProtocol(
+            entry.data[CONF_HOST],
+            entry.data[CONF_PORT],
         )
-        self.username = entry.data.get("username", "user")
-        self.password = entry.data["password"]
+        self.username = entry.data[CONF_USERNAME]
+        self.password = entry.data[CONF_PASSWORD]
         self._outlet_count: int | None = None
+        # Outlets polled each update; set alongside _outlet_count
+        self._outlet_ids: list[int] = []
+        self._outlet_names: dict[int, str] = {}
+        # Entries are only replaced when an outlet's state or name changes
+        self._outlets: dict[int, Outlet] = {}
+        # When each outlet's state was last read or acknowledged (monotonic)
+        self._state_at: dict[int, float] = {}
+        self._names_fetched_at: float = 0.0
+        self._sensor_last: dict[str, tuple[float, float | None]] = {}
+        # Latest sensor readings by key, read directly by the sensor entities
+        self.sensors: dict[str, float | None] = {}
+        self._last_hash: int | None = None
+        self._stable_cycles = 0
 
         super().__init__(
             hass,
@@ -37,188 +103,268 @@ class RackLinkCoordinator(DataUpdateCoordinator):
             update_interval=UPDATE_INTERVAL,
         )
 
+        self._refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SWITCH_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+    def _eager(self, coro: Coroutine[Any, Any, _T], name: str) -> asyncio.Task[_T]:
+        """Start a fan-out request eagerly so it writes without a loop pass."""
+        return self.hass.async_create_task(coro, f"racklink_{name}", eager_start=True)
+
+    async def _keepalive(self) -> None:
+        """Ping the device between updates so the connection stays open."""
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            if not self.client.connected_event.is_set():
+                continue
+            try:
+                # Many devices never answer client pings; don't wait for one
+                await self.client.ping_send()
+            except (OSError, asyncio.TimeoutError) as err:
+                # Best effort; the next update reconnects if the socket died
+                _LOGGER.debug("Keepalive ping failed: %s", err)
+
+    @callback
+    def async_start_keepalive(self) -> None:
+        """Start pinging the device; the task is cancelled when the entry unloads."""
+        self.config_entry.async_create_background_task(
+            self.hass, self._keepalive(), "racklink_keepalive", eager_start=True
+        )
+
+    async def async_shutdown(self) -> None:
+        """Stop pending refreshes and close the connection."""
+        await super().async_shutdown()
+        self._refresh_debouncer.async_shutdown()
+        await self.client.disconnect()
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Device information shared by every entity of this entry."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.config_entry.entry_id)},
+            name=f"RackLink {self.client.host}",
+            manufacturer=MANUFACTURER,
+            model="RackLink",
+        )
+
+    @callback
+    def async_schedule_refresh(self) -> None:
+        """Refresh shortly, coalescing a burst of calls into one update."""
+        self._refresh_debouncer.async_schedule_call()
+
+    @callback
+    def async_set_outlet_state(self, outlet_index: int, state: bool) -> None:
+        """Record a state the device acknowledged and notify every entity."""
+        self._state_at[outlet_index] = time.monotonic()
+        prev = self._outlets.get(outlet_index)
+        self._outlets[outlet_index] = Outlet(
+            state, prev.name if prev else f"Outlet {outlet_index}"
+        )
+        self.async_set_updated_data({**self.data, "outlets": self._outlets})
+
+    def outlet_state_age(self, outlet_index: int) -> float:
+        """Seconds since the outlet's state was last read or acknowledged."""
+        read_at = self._state_at.get(outlet_index)
+        return float("inf") if read_at is None else time.monotonic() - read_at
+
+    def invalidate_names(self) -> None:
+        """Force outlet names to be re-read on the next update."""
+        self._outlet_names.clear()
+        self._names_fetched_at = 0.0
+
+    async def _async_connect(self) -> None:
+        """Open the connection and log in, raising UpdateFailed on failure."""
+        _LOGGER.debug("Connecting to %s:%d", self.client.host, self.client.port)
+        async with asyncio.timeout(CONNECT_TIMEOUT):
+            if not await self.client.connect():
+                _LOGGER.error("Connection failed to %s:%d", self.client.host, self.client.port)
+                raise UpdateFailed("Failed to connect to RackLink device")
+            if not await self.client.login(self.username, self.password):
+                _LOGGER.error("Login failed for user: %s", self.username)
+                await self.client.disconnect()
+                raise UpdateFailed("Failed to login to RackLink device")
+        _LOGGER.debug("Login successful")
+
+    async def _async_fetch_outlet_count(self) -> int:
+        """Read the outlet count, reconnecting once if the device doesn't answer."""
+        count = await self.client.get_outlet_count()
+        if count is None:
+            # If we can't get count, connection might be lost
+            _LOGGER.warning("Failed to get outlet count, connection may be lost")
+            await self.client.disconnect()
+            await self._async_connect()
+            # Try again
+            count = await self.client.get_outlet_count()
+            if count is None:
+                _LOGGER.warning("Using default outlet count of 8")
+                return 8  # Default fallback
+        # Safety: Cap at 8 (RLNK-SW715R has 8 outlets)
+        if count > 16:
+            _LOGGER.warning("Outlet count %d seems invalid, defaulting to 8", count)
+            count = 8
+        _LOGGER.debug("Outlet count: %d", count)
+        return count
+
+    def _adapt_interval(self, outlets: dict[int, Outlet]) -> None:
+        """Poll less often while outlet data is unchanged, reset on change."""
+        outlets_hash = hash(tuple(sorted(outlets.items())))
+        if outlets_hash == self._last_hash:
+            self._stable_cycles += 1
+            self.update_interval = min(
+                MAX_UPDATE_INTERVAL, UPDATE_INTERVAL * (1 + self._stable_cycles)
+            )
+        else:
+            self._last_hash = outlets_hash
+            self._stable_cycles = 0
+            self.update_interval = UPDATE_INTERVAL
+
     async def _async_update_data(self) -> dict:
         """Fetch data from RackLink."""
-        _LOGGER.debug("Starting data update")
+        # Checked once so the per-outlet/per-sensor loops skip logging calls
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Starting data update")
         try:
             # Ensure we're connected
-            if not self.client._connected:
+            if not self.client.connected_event.is_set():
                 _LOGGER.info("Not connected, establishing connection...")
-                _LOGGER.debug("Connecting to %s:%d", self.client.host, self.client.port)
-                if not await self.client.connect():
-                    _LOGGER.error("Connection failed to %s:%d", self.client.host, self.client.port)
-                    raise UpdateFailed("Failed to connect to RackLink device")
-                _LOGGER.debug("TCP connection established, attempting login...")
-                if not await self.client.login(self.username, self.password):
-                    _LOGGER.error("Login failed for user: %s", self.username)
-                    await self.client.disconnect()
-                    raise UpdateFailed("Failed to login to RackLink device")
-                _LOGGER.debug("Login successful")
+                # Readings from the previous session can't be trusted to be fresh
+                self._sensor_last.clear()
+                await self._async_connect()
 
             # Test connection with a real command (outlet count)
             # This serves as both connection test and initialization
             if self._outlet_count is None:
-                _LOGGER.debug("Fetching outlet count...")
-                count = await self.client.get_outlet_count()
-                if count is None:
-                    # If we can't get count, connection might be lost
-                    _LOGGER.warning("Failed to get outlet count, connection may be lost")
-                    _LOGGER.debug("Attempting reconnection...")
-                    await self.client.disconnect()
-                    if not await self.client.connect():
-                        _LOGGER.error("Reconnection failed")
-                        raise UpdateFailed("Failed to reconnect to RackLink device")
-                    if not await self.client.login(self.username, self.password):
-                        _LOGGER.error("Re-login failed")
-                        await self.client.disconnect()
-                        raise UpdateFailed("Failed to re-login to RackLink device")
-                    # Try again
-                    _LOGGER.debug("Retrying outlet count after reconnection...")
-                    count = await self.client.get_outlet_count()
-                    if count is None:
-                        _LOGGER.warning("Using default outlet count of 8")
-                        self._outlet_count = 8  # Default fallback
-                    else:
-                        # Safety: Cap at 8 (RLNK-SW715R has 8 outlets)
-                        if count > 16:
-                            _LOGGER.warning("Outlet count %d seems invalid, defaulting to 8", count)
-                            count = 8
-                        _LOGGER.debug("Outlet count retrieved: %d", count)
-                        self._outlet_count = count
-                else:
-                    # Safety: Cap at 8 (RLNK-SW715R has 8 outlets)
-                    if count > 16:
-                        _LOGGER.warning("Outlet count %d seems invalid, defaulting to 8", count)
-                        count = 8
-                    _LOGGER.debug("Outlet count: %d", count)
-                    self._outlet_count = count
-
-            # Just fetch outlet names for now - keep it simple
-            # Safety: Cap outlet count at 8 (RLNK-SW715R has 8 outlets)
-            outlet_count = min(self._outlet_count or 8, 8)
-            _LOGGER.debug("Fetching outlet names for %d outlets (capped at 16)", outlet_count)
-            outlets: dict[int, dict] = {}
-            for i in range(1, outlet_count + 1):
-                try:
-                    # Check connection before each request
-                    if not self.client._connected:
-                        _LOGGER.warning("Connection lost, reconnecting before fetching outlet %d name...", i)
-                        await self.client.disconnect()
-                        if not await self.client.connect():
-                            _LOGGER.error("Failed to reconnect")
-                            break
-                        if not await self.client.login(self.username, self.password):
-                            _LOGGER.error("Failed to re-login")
-                            await self.client.disconnect()
-                            break
-                    
-                    _LOGGER.debug("Fetching outlet %d name...", i)
-                    name = await self.client.get_outlet_name(i)
-                    _LOGGER.debug("Outlet %d name: %s", i, name)
-                    outlets[i] = {
-                        "name": name or f"Outlet {i}",
-                    }
-                except ConnectionError:
-                    _LOGGER.warning("Connection lost while fetching outlet %d name, will retry next update", i)
-                    outlets[i] = {
-                        "name": f"Outlet {i}",
-                    }
-                    # Mark as disconnected so we reconnect next time
-                    self.client._connected = False
-                except Exception as outlet_err:
-                    _LOGGER.warning("Error fetching outlet %d name: %s", i, outlet_err, exc_info=True)
-                    # Continue with other outlets
-                    outlets[i] = {
-                        "name": f"Outlet {i}",
-                    }
+                # Each step bounds itself, so the default-count fallback in
+                # there is reached even after a reconnect
+                self._outlet_count = await self._async_fetch_outlet_count()
+                # Safety: Cap outlet count at 8 (RLNK-SW715R has 8 outlets)
+                self._outlet_ids = list(range(1, min(self._outlet_count, 8) + 1))
+            outlet_ids = self._outlet_ids
+
+            # Names are cached; only re-read them hourly or for new outlets
+            now = time.monotonic()
+            if now - self._names_fetched_at > NAME_REFRESH_INTERVAL:
+                self._outlet_names.clear()
+                self._names_fetched_at = now
+            name_ids = [i for i in outlet_ids if i not in self._outlet_names]
+            if debug:
+                _LOGGER.debug(
+                    "Fetching state for %d outlets, name for %d",
+                    len(outlet_ids),
+                    len(name_ids),
+                )
+
+            # Issue every outlet read at once; the protocol client pipelines
+            # them on the socket and matches the responses as they arrive
+            async with asyncio.timeout(BATCH_TIMEOUT):
+                states, fetched_names = await asyncio.gather(
+                    asyncio.gather(
+                        *(
+                            self._eager(self.client.get_outlet_state(i), f"state_{i}")
+                            for i in outlet_ids
+                        ),
+                        return_exceptions=True,
+                    ),
+                    asyncio.gather(
+                        *(
+                            self._eager(self.client.get_outlet_name(i), f"name_{i}")
+                            for i in name_ids
+                        ),
+                        return_exceptions=True,
+                    ),
+                )
+            names: dict[int, str | BaseException | None] = dict(
+                zip(name_ids, fetched_names)
+            )
+            outlets = self._outlets
+            read_at = time.monotonic()
+            for i, state in zip(outlet_ids, states):
+                name = names.get(i, self._outlet_names.get(i))
+                for result in (state, name):
+                    if isinstance(result, ConnectionError):
+                        # The client has already cleared connected_event, so
+                        # the next update reconnects
+                        _LOGGER.warning("Connection lost while fetching outlet %d, will retry next update", i)
+                    elif isinstance(result, OSError):
+                        # Includes timeouts; expected while the device is unreachable
+                        _LOGGER.debug("Error fetching outlet %d: %s", i, result)
+                    elif isinstance(result, BaseException):
+                        # Unexpected; let the outer handler report it
+                        raise result
+                if isinstance(state, BaseException):
+                    state = None
+                elif state is not None:
+                    self._state_at[i] = read_at
+                if isinstance(name, BaseException):
+                    name = None
+                elif name and i in names:
+                    self._outlet_names[i] = name
+                if debug:
+                    _LOGGER.debug("Outlet %d: name=%s, state=%s", i, name, state)
+                name = name or f"Outlet {i}"
+                prev = outlets.get(i)
+                if prev is None or prev.state != state or prev.name != name:
+                    outlets[i] = Outlet(state, name)
 
             # Fetch sensor data (temperature, voltage, current, power, etc.)
-            _LOGGER.debug("Fetching sensor data...")
-            sensors: dict[str, float | None] = {}
-            try:
-                # Temperature (0x50)
-                _LOGGER.debug("Reading temperature (0x50)...")
-                temp = await self.client.get_temperature()
-                if temp is not None:
-                    _LOGGER.debug("Temperature: %.1f°F", temp)
-                    sensors["temperature"] = temp
-                else:
-                    _LOGGER.debug("Temperature: No data")
-                
-                # Voltage RMS (0x51)
-                _LOGGER.debug("Reading voltage (0x51)...")
-                voltage = await self.client.get_voltage()
-                if voltage is not None:
-                    _LOGGER.debug("Voltage: %.1fV", voltage)
-                    sensors["voltage"] = voltage
-                else:
-                    _LOGGER.debug("Voltage: No data")
-                
-                # Current RMS (0x52)
-                _LOGGER.debug("Reading current (0x52)...")
-                current = await self.client.get_current()
-                if current is not None:
-                    _LOGGER.debug("Current: %.2fA", current)
-                    sensors["current"] = current
-                else:
-                    _LOGGER.debug("Current: No data")
-                
-                # Power/Wattage (0x53)
-                _LOGGER.debug("Reading power (0x53)...")
-                power = await self.client.get_power()
-                if power is not None:
-                    _LOGGER.debug("Power: %.1fW", power)
-                    sensors["power"] = power
-                else:
-                    _LOGGER.debug("Power: No data")
-                
-                # Power Factor (0x54)
-                _LOGGER.debug("Reading power factor (0x54)...")
-                power_factor = await self.client.get_power_factor()
-                if power_factor is not None:
-                    _LOGGER.debug("Power Factor: %.3f", power_factor)
-                    sensors["power_factor"] = power_factor
-                else:
-                    _LOGGER.debug("Power Factor: No data")
-                
-                # Thermal Load (0x55)
-                _LOGGER.debug("Reading thermal load (0x55)...")
-                thermal_load = await self.client.get_thermal_load()
-                if thermal_load is not None:
-                    _LOGGER.debug("Thermal Load: %.1f", thermal_load)
-                    sensors["thermal_load"] = thermal_load
-                else:
-                    _LOGGER.debug("Thermal Load: No data")
-                
-                # Occupancy (0x56)
-                _LOGGER.debug("Reading occupancy (0x56)...")
-                occupancy = await self.client.get_occupancy()
-                if occupancy is not None:
-                    _LOGGER.debug("Occupancy: %.0f", occupancy)
-                    sensors["occupancy"] = occupancy
+            # Readings still within their TTL are reused; the rest are read
+            # as one pipelined block
+            now = time.monotonic()
+            stale = [
+                (key, register)
+                for key, register, ttl in SENSORS
+                if key not in self._sensor_last
+                or now - self._sensor_last[key][0] >= ttl
+            ]
+            if stale:
+                try:
+                    async with asyncio.timeout(BATCH_TIMEOUT):
+                        block = await self.client.get_sensor_values(
+                            register for _, register in stale
+                        )
+                except OSError as sensor_err:
+                    # Includes the batch timing out; keep the cached readings
+                    _LOGGER.debug("Error fetching sensors: %s", sensor_err)
                 else:
-                    _LOGGER.debug("Occupancy: No data")
-                    
-                _LOGGER.debug("Sensor data fetch complete. Got %d sensors", len(sensors))
-            except Exception as sensor_err:
-                _LOGGER.warning("Error fetching sensors: %s", sensor_err, exc_info=True)
-
-            _LOGGER.debug("Data update complete: %d outlets, %d sensors", 
-                         len(outlets), len(sensors))
+                    for key, register in stale:
+                        value = block[register]
+                        if debug:
+                            _LOGGER.debug("%s: %s", key, value)
+                        self._sensor_last[key] = (now, value)
+            self.sensors = sensors = {
+                key: value
+                for key, (_, value) in self._sensor_last.items()
+                if value is not None
+            }
+            self._adapt_interval(outlets)
+            if debug:
+                _LOGGER.debug("Data update complete: %d outlets, %d sensors",
+                              len(outlets), len(sensors))
             return {
                 "outlets": outlets,
-                "sensors": sensors,
                 "connected": True,
             }
         except UpdateFailed:
             # Re-raise UpdateFailed as-is
             raise
+        except TimeoutError as err:
+            # A wedged socket: drop it rather than block the next update too
+            _LOGGER.error("Timed out communicating with RackLink")
+            await self.client.disconnect()
+            raise UpdateFailed("Timed out communicating with RackLink device") from err
+        except OSError as err:
+            # Transport failure: the socket is dead, reconnect next update
+            _LOGGER.error("Connection to RackLink lost: %s", err)
+            await self.client.disconnect()
+            raise UpdateFailed(f"Connection to RackLink lost: {err}") from err
         except Exception as err:
-            _LOGGER.error("Error communicating with RackLink: %s", err, exc_info=True)
-            # Mark as disconnected on any error
-            if self.client._connected:
-                try:
-                    await self.client.disconnect()
-                except:
-                    pass
+            # Application-level error: keep the connection for the next update
+            # Tracebacks are costly to format; only include one when debugging
+            _LOGGER.error("Error communicating with RackLink: %s", err,
+                          exc_info=_LOGGER.isEnabledFor(logging.DEBUG))
             raise UpdateFailed(f"Error communicating with RackLink: {err}") from err
@@ -3,8 +3,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 import socket
-from typing import Any
+import struct
+from collections import deque
+from collections.abc import Iterable
+from typing import NamedTuple
 
 from .const import (
     CMD_LOGIN,
@@ -13,6 +17,8 @@ from .const import (
     CMD_OUTLET_NAME,
     CMD_PING,
     CMD_POWER_OUTLETS,
+    CMD_SENSORS_END,
+    CMD_SENSORS_START,
     PROTOCOL_ESCAPE,
     PROTOCOL_HEADER,
     PROTOCOL_PORT,
@@ -24,6 +30,110 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+UNSOLICITED_QUEUE_SIZE = 32
+# Seconds to wait for each step: the TCP connect, a request's response and
+# the device's first ping after login
+REQUEST_TIMEOUT = 5.0
+# Receive buffer size; a packet is at most 254 bytes on the wire
+RECV_BUFFER_SIZE = 1024
+
+# Protected bytes and the two-byte sequences that replace them on the wire
+_ESCAPE_BYTE = bytes((PROTOCOL_ESCAPE,))
+_HEADER_BYTE = bytes((PROTOCOL_HEADER,))
+_TAIL_BYTE = bytes((PROTOCOL_TAIL,))
+_ESC_ESCAPE = bytes((PROTOCOL_ESCAPE, PROTOCOL_ESCAPE ^ 0xFF))
+_ESC_HEADER = bytes((PROTOCOL_ESCAPE, PROTOCOL_HEADER ^ 0xFF))
+_ESC_TAIL = bytes((PROTOCOL_ESCAPE, PROTOCOL_TAIL ^ 0xFF))
+# Numeric reading in a sensor response, e.g. b"120.5" or b"-3,"
+_NUM_RE = re.compile(rb"-?\d+(?:\.\d*)?")
+# bytes.translate table mapping each byte to its complement
+_COMPLEMENT = bytes(b ^ 0xFF for b in range(256))
+# Per-outlet commands; their responses echo the outlet index in data[0]
+_INDEXED_COMMANDS = frozenset((CMD_POWER_OUTLETS, CMD_OUTLET_NAME))
+# Two-byte frame pieces: (header, length) and (checksum, tail)
+_BYTE_PAIR = struct.Struct("BB")
+
+
+class ParsedPacket(NamedTuple):
+    """A received packet's unescaped envelope."""
+
+    destination: int
+    command: int
+    subcommand: int
+    data: bytes
+
+
+class RackLinkBufferedProtocol(asyncio.BufferedProtocol):
+    """Frame packets straight out of a reusable receive buffer.
+
+    The transport reads into one preallocated bytearray; each complete packet
+    is copied out once and handed to the client, and any partial packet is
+    moved to the front of the buffer to wait for the rest.
+    """
+
+    def __init__(self, client: RackLinkProtocol) -> None:
+        """Initialize the protocol."""
+        self._client = client
+        self._buffer = bytearray(RECV_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._filled = 0
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+        self.closed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return the free tail of the receive buffer."""
+        return self._view[self._filled:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Dispatch every complete packet now in the buffer."""
+        buf = self._buffer
+        end = self._filled + nbytes
+        pos = 0
+        while pos < end:
+            if buf[pos] != PROTOCOL_HEADER:
+                # 0xFE never appears inside a packet, so resync on the next one
+                start = buf.find(PROTOCOL_HEADER, pos, end)
+                _LOGGER.warning("Invalid header: 0x%02X (expected 0x%02X)",
+                                buf[pos], PROTOCOL_HEADER)
+                pos = end if start < 0 else start
+                continue
+            if end - pos < 2:
+                break
+            length = buf[pos + 1]
+            if length > 250:  # Max data envelope size per protocol
+                _LOGGER.error("Invalid length: %d (max 250)", length)
+                pos += 1
+                continue
+            stop = pos + length + 4  # header + length + data + checksum + tail
+            if stop > end:
+                break
+            self._client._packet_received(bytes(self._view[pos:stop]))
+            pos = stop
+        # Keep the unfinished packet, if any, at the front of the buffer
+        self._filled = end - pos
+        if pos and self._filled:
+            buf[: self._filled] = buf[pos:end]
+
+    def pause_writing(self) -> None:
+        """Hold senders until the transport's buffer drains."""
+        self._can_write.clear()
+
+    def resume_writing(self) -> None:
+        """Let senders continue."""
+        self._can_write.set()
+
+    async def drain(self) -> None:
+        """Wait until the transport is ready for more data."""
+        await self._can_write.wait()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Report the closed connection to the client."""
+        self._can_write.set()
+        if not self.closed.done():
+            self.closed.set_result(None)
+        self._client._connection_lost(exc)
+
 
 class RackLinkProtocol:
     """RackLink Protocol client implementation."""
@@ -32,18 +142,55 @@ class RackLinkProtocol:
         """Initialize the protocol client."""
         self.host = host
         self.port = port
-        self._reader: asyncio.StreamReader | None = None
-        self._writer: asyncio.StreamWriter | None = None
+        self._transport: asyncio.Transport | None = None
+        self._protocol: RackLinkBufferedProtocol | None = None
         self._connected = False
+        # Set once logged in and ready for commands, cleared when the link drops
+        self.connected_event = asyncio.Event()
         self._ping_task: asyncio.Task | None = None
+        # Requests awaiting a response, oldest first, as (command, outlet
+        # index or None, future). The device does not tag responses, so they
+        # are matched by command byte in send order, and per-outlet responses
+        # additionally by the index they echo.
+        self._pending: deque[tuple[int, int | None, asyncio.Future]] = deque()
+        # Packets that did not answer a pending request (pings, status updates)
+        self._unsolicited: asyncio.Queue[ParsedPacket] = asyncio.Queue(
+            maxsize=UNSOLICITED_QUEUE_SIZE
+        )
+        self._pinged = asyncio.Event()
+        # Packets written during the current loop iteration, flushed together
+        self._outgoing: list[bytes] = []
+        # Last packet parsed and its result; steady readings repeat verbatim
+        self._last_raw: bytes | None = None
+        self._last_parsed: ParsedPacket | None = None
+        # Per-outlet packets by (command, subcommand, data), built once the
+        # outlet count is known
+        self._outlet_packets: dict[tuple[int, int, bytes], bytes] = {}
+        # Login packet for the last credentials used; rebuilt if they change
+        self._login_credentials: tuple[str, str] | None = None
+        self._login_packet = b""
 
     async def connect(self) -> bool:
         """Connect to the RackLink device."""
         _LOGGER.debug("Attempting to connect to %s:%d", self.host, self.port)
+        if self._transport:
+            # Drop whatever is left of a previous session first
+            await self.disconnect()
+        self._unsolicited = asyncio.Queue(maxsize=UNSOLICITED_QUEUE_SIZE)
+        loop = asyncio.get_running_loop()
         try:
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port), timeout=5.0
-            )
+            async with asyncio.timeout(REQUEST_TIMEOUT):
+                self._transport, self._protocol = await loop.create_connection(
+                    lambda: RackLinkBufferedProtocol(self), self.host, self.port
+                )
+            # Requests are a few bytes each and always wait for an answer,
+            # so Nagle would only add latency
+            sock = self._transport.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                # Let the kernel notice a peer that vanished without a FIN
+                # even while the connection is idle between polls
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             self._connected = True
             _LOGGER.info("Connected to RackLink device at %s:%d", self.host, self.port)
             _LOGGER.debug("TCP connection established successfully")
@@ -61,71 +208,105 @@ class RackLinkProtocol:
     async def disconnect(self) -> None:
         """Disconnect from the RackLink device."""
         self._connected = False
+        self.connected_event.clear()
         if self._ping_task:
             self._ping_task.cancel()
             try:
                 await self._ping_task
             except asyncio.CancelledError:
                 pass
-        if self._writer:
-            self._writer.close()
-            await self._writer.wait_closed()
-        self._reader = None
-        self._writer = None
-
-    def _escape_data(self, data: list[int]) -> list[int]:
-        """Escape protected values in data envelope."""
-        escaped: list[int] = []
-        protected = [PROTOCOL_HEADER, PROTOCOL_TAIL, PROTOCOL_ESCAPE]
-        for byte in data:
-            if byte in protected:
-                escaped.append(PROTOCOL_ESCAPE)
-                escaped.append((~byte) & 0xFF)
-            else:
-                escaped.append(byte)
-        return escaped
-
-    def _unescape_data(self, data: list[int]) -> list[int]:
-        """Unescape protected values in data envelope."""
-        unescaped: list[int] = []
-        i = 0
-        while i < len(data):
-            if data[i] == PROTOCOL_ESCAPE and i + 1 < len(data):
-                unescaped.append((~data[i + 1]) & 0xFF)
-                i += 2
-            else:
-                unescaped.append(data[i])
-                i += 1
-        return unescaped
+        self._ping_task = None
+        self._fail_pending()
+        if self._transport and self._protocol:
+            self._transport.close()
+            # Resolved by connection_lost once the socket is closed
+            await self._protocol.closed
+        self._transport = None
+        self._protocol = None
+
+    @staticmethod
+    def _escape_data(data: bytes | bytearray) -> tuple[bytes | bytearray, int]:
+        """Escape protected values in data envelope.
+
+        Returns the escaped bytes and the byte sum of the unescaped envelope,
+        which is what the checksum covers.
+        """
+        # Most envelopes contain no protected bytes; three memchr scans
+        # confirm that without copying
+        if (
+            data.find(PROTOCOL_ESCAPE) < 0
+            and data.find(PROTOCOL_HEADER) < 0
+            and data.find(PROTOCOL_TAIL) < 0
+        ):
+            return data, sum(data)
+        # ESCAPE must go first so the sequences added below aren't re-escaped
+        escaped = (
+            data.replace(_ESCAPE_BYTE, _ESC_ESCAPE)
+            .replace(_HEADER_BYTE, _ESC_HEADER)
+            .replace(_TAIL_BYTE, _ESC_TAIL)
+        )
+        return escaped, sum(data)
+
+    @staticmethod
+    def _unescape_data(data: bytes) -> tuple[bytes, int]:
+        """Unescape protected values in data envelope.
 
-    def _calculate_checksum(self, header: int, length: int, data: list[int]) -> int:
+        Returns the unescaped bytes and their byte sum for checksum validation.
+        """
+        i = data.find(PROTOCOL_ESCAPE)
+        if i < 0:
+            # Nothing escaped: the wire bytes are the envelope
+            return bytes(data), sum(data)
+        unescaped = bytearray()
+        start = 0
+        while 0 <= i < len(data) - 1:
+            unescaped += data[start:i]
+            unescaped += data[i + 1 : i + 2].translate(_COMPLEMENT)
+            start = i + 2
+            i = data.find(PROTOCOL_ESCAPE, start)
+        # A trailing ESCAPE with nothing after it is kept as-is
+        unescaped += data[start:]
+        return bytes(unescaped), sum(unescaped)
+
+    @staticmethod
+    def _calculate_checksum(
+        header: int, length: int, data: bytes | bytearray | memoryview
+    ) -> int:
         """Calculate 7-bit checksum."""
-        total = header + length
-        for byte in data:
-            total += byte
-        return total & 0x7F
+        return (header + length + sum(data)) & 0x7F
 
-    def build_packet(self, data_envelope: list[int]) -> bytes:
+    @staticmethod
+    def build_packet(data_envelope: bytes | bytearray) -> bytes:
         """Build a protocol packet from data envelope."""
         header = PROTOCOL_HEADER
         tail = PROTOCOL_TAIL
         
         # Escape the data envelope
-        escaped_envelope = self._escape_data(data_envelope)
+        escaped_envelope, data_sum = RackLinkProtocol._escape_data(data_envelope)
         length = len(escaped_envelope)
         
-        # Calculate checksum (header + length + unescaped data envelope)
-        checksum = self._calculate_checksum(header, length, data_envelope)
+        # Checksum covers header + length + unescaped data envelope
+        checksum = (header + length + data_sum) & 0x7F
         
         # Build packet: header, length, escaped_envelope, checksum, tail
-        packet = bytes([header, length] + escaped_envelope + [checksum, tail])
-        _LOGGER.debug("Built packet: len=%d, checksum=0x%02X, envelope=%s", 
-                     length, checksum, [hex(b) for b in data_envelope])
+        packet = (
+            _BYTE_PAIR.pack(header, length)
+            + escaped_envelope
+            + _BYTE_PAIR.pack(checksum, tail)
+        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Built packet: len=%d, checksum=0x%02X, envelope=%s", 
+                         length, checksum, bytes(data_envelope).hex(' '))
         return packet
 
-    def parse_packet(self, packet: bytes) -> dict[str, Any] | None:
+    def parse_packet(self, packet: bytes) -> ParsedPacket | None:
         """Parse a protocol packet."""
-        _LOGGER.debug("Parsing packet: %s", packet.hex(' ').upper())
+        if packet == self._last_raw:
+            return self._last_parsed
+        # Runs for every received packet; skip the hex dumps unless debugging
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Parsing packet: %s", packet.hex(' ').upper())
         if len(packet) < 5:
             _LOGGER.debug("Packet too short: %d bytes", len(packet))
             return None
@@ -140,110 +321,170 @@ class RackLinkProtocol:
             _LOGGER.debug("Packet length mismatch: expected %d, got %d", 
                          length + 4, len(packet))
             return None
+        if length > 250:  # Max data envelope size per protocol
+            _LOGGER.debug("Invalid length: %d (max 250)", length)
+            return None
+        
+        # Escaping only lengthens the envelope, so this can be rejected
+        # before any unescaping or summing
+        if length < 3:
+            _LOGGER.debug("Data envelope too short: %d bytes", length)
+            return None
         
-        # Extract escaped envelope and checksum
-        escaped_envelope = list(packet[2:-2])
         received_checksum = packet[-2]
         
-        # Unescape the envelope
-        data_envelope = self._unescape_data(escaped_envelope)
+        # Escapes are rare; a memchr settles it. Without any, the wire bytes
+        # are the envelope, so the checksum is verified before anything is
+        # copied out of the packet.
+        if packet.find(PROTOCOL_ESCAPE, 2, -2) < 0:
+            data_envelope = None
+            data_sum = sum(packet) - PROTOCOL_HEADER - length - received_checksum - PROTOCOL_TAIL
+        else:
+            data_envelope, data_sum = self._unescape_data(packet[2:-2])
         
         # Verify checksum
-        expected_checksum = self._calculate_checksum(PROTOCOL_HEADER, length, data_envelope)
+        expected_checksum = (PROTOCOL_HEADER + length + data_sum) & 0x7F
         if received_checksum != expected_checksum:
             _LOGGER.warning("Checksum mismatch: received 0x%02X, expected 0x%02X", 
                           received_checksum, expected_checksum)
             return None
         
-        if len(data_envelope) < 3:
+        if data_envelope is None:
+            parsed = ParsedPacket(packet[2], packet[3], packet[4], packet[5:-2])
+        elif len(data_envelope) < 3:
             _LOGGER.debug("Data envelope too short: %d bytes", len(data_envelope))
             return None
-        
-        parsed = {
-            "destination": data_envelope[0],
-            "command": data_envelope[1],
-            "subcommand": data_envelope[2],
-            "data": data_envelope[3:] if len(data_envelope) > 3 else [],
-        }
-        _LOGGER.debug("Parsed packet: dest=0x%02X, cmd=0x%02X, sub=0x%02X, data_len=%d",
-                     parsed["destination"], parsed["command"], parsed["subcommand"], 
-                     len(parsed["data"]))
+        else:
+            parsed = ParsedPacket(
+                data_envelope[0], data_envelope[1], data_envelope[2], data_envelope[3:]
+            )
+        if debug:
+            _LOGGER.debug("Parsed packet: dest=0x%02X, cmd=0x%02X, sub=0x%02X, data_len=%d",
+                         parsed.destination, parsed.command, parsed.subcommand, 
+                         len(parsed.data))
+        self._last_raw = packet
+        self._last_parsed = parsed
         return parsed
 
+    def _write(self, packet: bytes) -> None:
+        """Queue a packet for the next flush.
+
+        Requests issued together (e.g. a gather of outlet reads) go out in a
+        single writelines() call instead of one send per packet.
+        """
+        self._outgoing.append(packet)
+        if len(self._outgoing) == 1:
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        """Write every queued packet to the transport."""
+        packets, self._outgoing = self._outgoing, []
+        if self._transport and not self._transport.is_closing():
+            self._transport.writelines(packets)
+        elif packets:
+            # The link went down before the write; nothing queued will be
+            # answered, so don't leave the senders waiting out their timeouts
+            _LOGGER.debug("Dropping %d queued packets, connection closed", len(packets))
+            self._fail_pending()
+
     async def send_packet(self, packet: bytes) -> None:
         """Send a packet to the device."""
-        if not self._connected or not self._writer:
+        if not self._connected or not self._transport or not self._protocol:
             raise ConnectionError("Not connected to device")
         try:
-            self._writer.write(packet)
-            await self._writer.drain()
+            self._write(packet)
+            await self._protocol.drain()
         except (OSError, ConnectionError) as e:
             _LOGGER.debug("Connection lost during send: %s", e)
             self._connected = False
+            self.connected_event.clear()
             raise ConnectionError(f"Connection lost: {e}") from e
 
-    async def receive_packet(self, timeout: float = 5.0) -> dict[str, Any] | None:
-        """Receive and parse a packet from the device."""
-        if not self._connected or not self._reader:
+    def _packet_received(self, packet: bytes) -> None:
+        """Parse a framed packet from the transport and dispatch it."""
+        parsed = self.parse_packet(packet)
+        if parsed:
+            self._dispatch(parsed)
+
+    def _connection_lost(self, exc: Exception | None) -> None:
+        """Mark the link down and fail whatever was waiting on it."""
+        if exc:
+            _LOGGER.debug("Connection error during read: %s", exc)
+        elif self._connected:
+            _LOGGER.debug("No data received (connection closed)")
+        self._connected = False
+        self.connected_event.clear()
+        self._fail_pending()
+
+    def _dispatch(self, packet: ParsedPacket) -> None:
+        """Hand a received packet to the request waiting for it."""
+        command = packet.command
+        if command == CMD_PING and packet.subcommand == SUB_SET:
+            # Device-initiated ping: it drops us after three unanswered pings
+            _LOGGER.debug("Received ping from device, responding...")
+            if self._transport:
+                self._write(_PONG_PACKET)
+            self._pinged.set()
+        elif packet.subcommand == SUB_RESPONSE:
+            # A NACK answers whichever request the device processed first
+            data = packet.data
+            for entry in self._pending:
+                pending_command, index, future = entry
+                if future.done():
+                    continue
+                if command == CMD_NACK or (
+                    command == pending_command
+                    and (index is None or (data and data[0] == index))
+                ):
+                    self._pending.remove(entry)
+                    future.set_result(packet)
+                    return
+        if self._unsolicited.full():
+            self._unsolicited.get_nowait()
+        self._unsolicited.put_nowait(packet)
+
+    def _fail_pending(self) -> None:
+        """Fail every request still waiting for a response."""
+        while self._pending:
+            _, _, future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(ConnectionError("Connection lost"))
+
+    async def _request(
+        self, packet: bytes, command: int, timeout: float, index: int | None = None
+    ) -> ParsedPacket | None:
+        """Send a packet and wait for the response to it.
+
+        Requests are written back-to-back without waiting for earlier
+        responses, so concurrent callers share the connection pipelined.
+        ``index`` restricts the match to responses echoing that outlet index.
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        entry = (command, index, future)
+        self._pending.append(entry)
+        try:
+            # One deadline covers both the write and the reply
+            async with asyncio.timeout(timeout):
+                await self.send_packet(packet)
+                return await future
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Timeout waiting for response to command 0x%02X (%.1fs)",
+                         command, timeout)
+            return None
+        finally:
+            if entry in self._pending:
+                self._pending.remove(entry)
+
+    async def receive_packet(self, timeout: float = REQUEST_TIMEOUT) -> ParsedPacket | None:
+        """Receive a packet that was not matched to a pending request."""
+        if not self._connected:
             raise ConnectionError("Not connected to device")
-        
         try:
-            # Read header first
-            try:
-                header_bytes = await asyncio.wait_for(self._reader.read(1), timeout=timeout)
-            except (OSError, ConnectionError) as e:
-                _LOGGER.debug("Connection error during read: %s", e)
-                self._connected = False
-                return None
-                
-            if not header_bytes:
-                _LOGGER.debug("No data received (connection closed)")
-                self._connected = False
-                return None
-                
-            if header_bytes[0] != PROTOCOL_HEADER:
-                _LOGGER.warning("Invalid header: 0x%02X (expected 0x%02X)", 
-                              header_bytes[0], PROTOCOL_HEADER)
-                return None
-            
-            # Read length
-            length_bytes = await asyncio.wait_for(self._reader.read(1), timeout=timeout)
-            if not length_bytes:
-                _LOGGER.debug("No length byte received")
-                self._connected = False
-                return None
-            
-            length = length_bytes[0]
-            
-            if length > 250:  # Max data envelope size per protocol
-                _LOGGER.error("Invalid length: %d (max 250)", length)
-                return None
-            
-            # Read rest of packet (data + checksum + tail)
-            remaining = await asyncio.wait_for(
-                self._reader.read(length + 2), timeout=timeout
-            )
-            if len(remaining) != length + 2:
-                _LOGGER.warning("Incomplete packet: expected %d bytes, got %d", 
-                              length + 2, len(remaining))
-                self._connected = False
-                return None
-            
-            packet = header_bytes + length_bytes + remaining
-            parsed = self.parse_packet(packet)
-            
-            if parsed:
-                _LOGGER.debug("Received packet: cmd=0x%02X, sub=0x%02X", 
-                            parsed["command"], parsed["subcommand"])
-            
-            return parsed
+            async with asyncio.timeout(timeout):
+                return await self._unsolicited.get()
         except asyncio.TimeoutError:
             _LOGGER.debug("Timeout waiting for packet (%.1fs)", timeout)
             return None
-        except Exception as e:
-            _LOGGER.error("Error receiving packet: %s", e, exc_info=True)
-            self._connected = False
-            return None
 
     async def login(self, username: str, password: str) -> bool:
         """Login to the RackLink device.
@@ -252,55 +493,51 @@ class RackLinkProtocol:
         that must be responded to with a RESPONSE message.
         """
         _LOGGER.debug("Attempting login for user: %s", username)
-        login_str = f"{username}|{password}"
-        data_envelope = [0x00, CMD_LOGIN, SUB_SET] + list(login_str.encode("ascii"))
-        packet = self.build_packet(data_envelope)
+        if self._login_credentials != (username, password):
+            data_envelope = bytearray((0x00, CMD_LOGIN, SUB_SET))
+            data_envelope += f"{username}|{password}".encode("ascii")
+            self._login_packet = self.build_packet(data_envelope)
+            self._login_credentials = (username, password)
+        packet = self._login_packet
         
         _LOGGER.debug("Sending login packet (length: %d bytes)", len(packet))
-        await self.send_packet(packet)
-        _LOGGER.debug("Waiting for login response...")
-        response = await self.receive_packet(timeout=5.0)
+        self._pinged.clear()
+        try:
+            response = await self._request(packet, CMD_LOGIN, timeout=REQUEST_TIMEOUT)
+        except ConnectionError as err:
+            _LOGGER.error("Connection lost during login: %s", err)
+            return False
         
         if not response:
             _LOGGER.error("No response to login")
             return False
         
         # Check for NACK
-        if response["command"] == CMD_NACK:
-            error_code = response["data"][0] if response["data"] else 0
+        if response.command == CMD_NACK:
+            error_code = response.data[0] if response.data else 0
             _LOGGER.error("Login NACK received, error code: 0x%02X", error_code)
             return False
         
         # Check for login response
-        if response["command"] == CMD_LOGIN and response["subcommand"] == SUB_RESPONSE:
-            if response["data"] and response["data"][0] == 0x01:
+        if response.command == CMD_LOGIN and response.subcommand == SUB_RESPONSE:
+            if response.data and response.data[0] == 0x01:
                 _LOGGER.info("Login successful")
                 
                 # Per protocol manual: Device sends a SET ping after login
-                # We must respond with a RESPONSE
+                # which must be answered before other commands are accepted.
+                # The receive path (_dispatch) answers it; wait until it has.
                 _LOGGER.debug("Waiting for initial ping from device...")
-                ping_response = await self.receive_packet(timeout=5.0)
-                
-                if ping_response:
-                    if ping_response["command"] == CMD_PING and ping_response["subcommand"] == SUB_SET:
-                        _LOGGER.debug("Received initial ping, responding...")
-                        # Respond with pong
-                        pong_envelope = [0x00, CMD_PING, SUB_RESPONSE]
-                        pong_packet = self.build_packet(pong_envelope)
-                        await self.send_packet(pong_packet)
-                        _LOGGER.debug("Sent pong response")
-                        return True
-                    else:
-                        _LOGGER.warning("Expected ping after login, got command 0x%02X", 
-                                      ping_response["command"])
-                        # Still consider login successful if we got login response
-                        return True
-                else:
+                try:
+                    async with asyncio.timeout(REQUEST_TIMEOUT):
+                        await self._pinged.wait()
+                    _LOGGER.debug("Answered initial ping")
+                except asyncio.TimeoutError:
                     _LOGGER.warning("No ping received after login, but login was successful")
-                    return True
+                self.connected_event.set()
+                return True
         
         _LOGGER.error("Login failed - unexpected response: command=0x%02X, sub=0x%02X",
-                     response["command"], response["subcommand"])
+                     response.command, response.subcommand)
         return False
 
     async def ping(self) -> bool:
@@ -309,58 +546,93 @@ class RackLinkProtocol:
         Note: Some devices may not respond to client-initiated pings.
         The protocol manual states devices send pings that we must respond to.
         """
-        data_envelope = [0x00, CMD_PING, SUB_SET]
-        packet = self.build_packet(data_envelope)
-        
-        _LOGGER.debug("Sending ping...")
-        await self.send_packet(packet)
-        response = await self.receive_packet(timeout=3.0)
+        response = await self._request(_PING_PACKET, CMD_PING, timeout=3.0)
         
         if response:
             _LOGGER.debug("Ping response: cmd=0x%02X, sub=0x%02X", 
-                         response["command"], response["subcommand"])
-            if response["command"] == CMD_PING and response["subcommand"] == SUB_RESPONSE:
+                         response.command, response.subcommand)
+            if response.command == CMD_PING and response.subcommand == SUB_RESPONSE:
                 _LOGGER.debug("Ping successful")
                 return True
-            elif response["command"] == CMD_NACK:
-                error_code = response["data"][0] if response["data"] else 0
+            elif response.command == CMD_NACK:
+                error_code = response.data[0] if response.data else 0
                 _LOGGER.debug("Ping received NACK, error: 0x%02X", error_code)
         else:
             _LOGGER.debug("No response to ping (device may not support client-initiated pings)")
         
         return False
 
+    async def ping_send(self) -> None:
+        """Send a ping without waiting for the reply.
+
+        Enough to keep the session alive. No pending slot is reserved: many
+        devices never answer, and an unanswered slot would capture a NACK
+        meant for a real request. A pong, if one comes, is queued as
+        unsolicited.
+        """
+        await self.send_packet(_PING_PACKET)
+
     async def send_command(
-        self, command: int, subcommand: int, data: list[int] | None = None
-    ) -> dict[str, Any] | None:
+        self, command: int, subcommand: int, data: bytes | None = None
+    ) -> ParsedPacket | None:
         """Send a command and return the response."""
-        data_envelope = [0x00, command, subcommand]
-        if data:
-            data_envelope.extend(data)
-        
-        _LOGGER.debug("Sending command: 0x%02X, subcommand: 0x%02X, data: %s", 
-                     command, subcommand, [hex(b) for b in data] if data else "None")
-        packet = self.build_packet(data_envelope)
-        _LOGGER.debug("Packet: %s", packet.hex(' ').upper())
-        await self.send_packet(packet)
+        if not data:
+            packet = _GET_PACKETS.get(command) if subcommand == SUB_GET else None
+        else:
+            packet = self._outlet_packets.get(
+                (command, subcommand, data)
+            ) or _patch_template(command, subcommand, data)
+        if packet is None:
+            data_envelope = bytearray((0x00, command, subcommand))
+            if data:
+                data_envelope += data
+            packet = self.build_packet(data_envelope)
         
-        response = await self.receive_packet(timeout=5.0)
+        # Called for every outlet/sensor read; don't format hex dumps unless
+        # someone is going to see them
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Sending command: 0x%02X, subcommand: 0x%02X, data: %s",
+                          command, subcommand, data.hex(' ') if data else "None")
+            _LOGGER.debug("Packet: %s", packet.hex(' ').upper())
+        index = data[0] if data and command in _INDEXED_COMMANDS else None
+        response = await self._request(packet, command, timeout=REQUEST_TIMEOUT, index=index)
         
-        if response:
-            _LOGGER.debug("Response received: cmd=0x%02X, sub=0x%02X, data_len=%d", 
-                         response["command"], response["subcommand"], len(response["data"]))
-        else:
+        if not response:
             _LOGGER.debug("No response received for command 0x%02X", command)
+        elif debug:
+            _LOGGER.debug("Response received: cmd=0x%02X, sub=0x%02X, data_len=%d", 
+                         response.command, response.subcommand, len(response.data))
         
         # Check for NACK
-        if response and response["command"] == CMD_NACK:
-            error_code = response["data"][0] if response["data"] else 0
+        if response and response.command == CMD_NACK:
+            error_code = response.data[0] if response.data else 0
             _LOGGER.warning("Command 0x%02X received NACK, error code: 0x%02X", 
                           command, error_code)
             return None
         
         return response
 
+    async def send_command_batch(
+        self, commands: Iterable[tuple[int, int, bytes | None]]
+    ) -> list[ParsedPacket | None]:
+        """Send several commands back-to-back and return their responses in order.
+
+        All the packets leave in one write and are answered in order, so the
+        batch costs about one round trip.
+        """
+        return await asyncio.gather(
+            *(self.send_command(command, sub, data) for command, sub, data in commands)
+        )
+
+    async def send_pipeline(
+        self, commands: Iterable[tuple[int, int, bytes | None]]
+    ) -> dict[int, ParsedPacket | None]:
+        """Like send_command_batch, keyed by command. Commands must be distinct."""
+        commands = list(commands)
+        responses = await self.send_command_batch(commands)
+        return {command: r for (command, _, _), r in zip(commands, responses)}
+
     async def get_outlet_count(self) -> int | None:
         """Get the number of power outlets.
         
@@ -368,15 +640,22 @@ class RackLinkProtocol:
         The response format is: [0x00, CMD_OUTLET_COUNT, SUB_RESPONSE, count_byte]
         """
         response = await self.send_command(CMD_OUTLET_COUNT, SUB_GET)
-        if response and response["command"] == CMD_OUTLET_COUNT and response["subcommand"] == SUB_RESPONSE:
-            if response["data"]:
+        count = self._parse_outlet_count(response)
+        if count is not None:
+            self._build_outlet_packets(count)
+        return count
+
+    @staticmethod
+    def _parse_outlet_count(response: ParsedPacket | None) -> int | None:
+        """Decode an outlet count response, defaulting to 8 when implausible."""
+        if response and response.command == CMD_OUTLET_COUNT and response.subcommand == SUB_RESPONSE:
+            if response.data:
                 # Log full response for debugging
-                _LOGGER.debug("Outlet count response - full data: %s (hex: %s)", 
-                            response["data"], [hex(b) for b in response["data"]])
+                _LOGGER.debug("Outlet count response - full data: %s", response.data)
                 
                 # Try to parse the count
                 # According to protocol, it should be a single byte
-                count = response["data"][0]
+                count = response.data[0]
                 
                 # Check if this looks like ASCII (common mistake)
                 # If count is > 127, it's definitely wrong
@@ -407,60 +686,99 @@ class RackLinkProtocol:
             _LOGGER.debug("Invalid outlet count response: %s", response)
         return None
 
+    def _build_outlet_packets(self, count: int) -> None:
+        """Prebuild the per-outlet state, switch and name packets."""
+        self._outlet_packets = {
+            (command, subcommand, data): _patch_template(command, subcommand, data)
+            or self.build_packet(bytes((0x00, command, subcommand)) + data)
+            for i in range(1, count + 1)
+            for command, subcommand, data in (
+                (CMD_POWER_OUTLETS, SUB_GET, bytes((i,))),
+                (CMD_POWER_OUTLETS, SUB_SET, bytes((i, 0x00))),
+                (CMD_POWER_OUTLETS, SUB_SET, bytes((i, 0x01))),
+                (CMD_OUTLET_NAME, SUB_GET, bytes((i,))),
+            )
+        }
+
     async def get_outlet_state(self, outlet_index: int) -> bool | None:
         """Get the state of a power outlet (1-indexed)."""
-        response = await self.send_command(CMD_POWER_OUTLETS, SUB_GET, [outlet_index])
-        if response and response["command"] == CMD_POWER_OUTLETS and response["subcommand"] == SUB_RESPONSE:
-            if len(response["data"]) >= 2:
-                return response["data"][1] == 0x01  # 0x01 = ON
+        response = await self.send_command(CMD_POWER_OUTLETS, SUB_GET, bytes((outlet_index,)))
+        return self._parse_outlet_state(response)
+
+    async def get_outlet_states(self, outlet_indices: Iterable[int]) -> dict[int, bool | None]:
+        """Get the states of several outlets in one batch."""
+        outlet_indices = list(outlet_indices)
+        responses = await self.send_command_batch(
+            (CMD_POWER_OUTLETS, SUB_GET, bytes((i,))) for i in outlet_indices
+        )
+        return {
+            i: self._parse_outlet_state(r) for i, r in zip(outlet_indices, responses)
+        }
+
+    async def get_all_outlet_states(self, count: int) -> dict[int, bool | None]:
+        """Get the states of outlets 1 to count as one pipelined batch."""
+        return await self.get_outlet_states(range(1, count + 1))
+
+    @staticmethod
+    def _parse_outlet_state(response: ParsedPacket | None) -> bool | None:
+        """Decode the state byte of a power outlet response."""
+        if response and response.command == CMD_POWER_OUTLETS and response.subcommand == SUB_RESPONSE:
+            if len(response.data) >= 2:
+                return response.data[1] == 0x01  # 0x01 = ON
         return None
 
     async def set_outlet_state(self, outlet_index: int, state: bool) -> bool:
         """Set the state of a power outlet (1-indexed)."""
         state_byte = 0x01 if state else 0x00
-        response = await self.send_command(CMD_POWER_OUTLETS, SUB_SET, [outlet_index, state_byte])
-        if response and response["command"] == CMD_POWER_OUTLETS and response["subcommand"] == SUB_RESPONSE:
+        response = await self.send_command(CMD_POWER_OUTLETS, SUB_SET, bytes((outlet_index, state_byte)))
+        if response and response.command == CMD_POWER_OUTLETS and response.subcommand == SUB_RESPONSE:
             return True
         return False
 
     async def get_outlet_name(self, outlet_index: int) -> str | None:
         """Get the name of a power outlet."""
-        response = await self.send_command(CMD_OUTLET_NAME, SUB_GET, [outlet_index])
-        if response and response["command"] == CMD_OUTLET_NAME and response["subcommand"] == SUB_RESPONSE:
-            if len(response["data"]) > 1:
-                name_bytes = response["data"][1:]
-                return bytes(name_bytes).decode("ascii", errors="ignore").rstrip("\x00")
+        response = await self.send_command(CMD_OUTLET_NAME, SUB_GET, bytes((outlet_index,)))
+        if response and response.command == CMD_OUTLET_NAME and response.subcommand == SUB_RESPONSE:
+            if len(response.data) > 1:
+                return response.data[1:].decode("ascii", errors="ignore").rstrip("\x00")
         return None
 
     async def _get_sensor_value(self, command: int) -> float | None:
         """Get a sensor value (generic helper)."""
-        _LOGGER.debug("Getting sensor value for command 0x%02X", command)
         response = await self.send_command(command, SUB_GET)
-        if response and response["command"] == command and response["subcommand"] == SUB_RESPONSE:
-            if response["data"]:
-                try:
-                    # Sensor values are typically ASCII-encoded
-                    raw_data = bytes(response["data"])
-                    value_str = raw_data.decode("ascii", errors="ignore").strip()
-                    _LOGGER.debug("Raw sensor data (0x%02X): %s (hex: %s)", 
-                                command, value_str, raw_data.hex(' '))
-                    # Remove any trailing commas or non-numeric characters
-                    value_str = value_str.rstrip(", \x00")
-                    if value_str:
-                        parsed_value = float(value_str)
-                        _LOGGER.debug("Parsed sensor value (0x%02X): %f", command, parsed_value)
-                        return parsed_value
-                    else:
-                        _LOGGER.debug("Empty sensor value string for command 0x%02X", command)
-                except (ValueError, TypeError) as e:
-                    _LOGGER.debug("Failed to parse sensor value for command 0x%02X: %s (data: %s)", 
-                                command, e, response["data"])
+        return self._parse_sensor_value(command, response)
+
+    @staticmethod
+    def _parse_sensor_value(command: int, response: ParsedPacket | None) -> float | None:
+        """Decode the ASCII reading in a sensor GET response."""
+        if response and response.command == command and response.subcommand == SUB_RESPONSE:
+            if response.data:
+                # Sensor values are ASCII-encoded, padded or followed by
+                # separators; pick the number straight out of the raw bytes
+                raw_data = response.data
+                _LOGGER.debug("Raw sensor data (0x%02X): %r", command, raw_data)
+                match = _NUM_RE.search(raw_data)
+                if match:
+                    parsed_value = float(match.group())
+                    _LOGGER.debug("Parsed sensor value (0x%02X): %f", command, parsed_value)
+                    return parsed_value
+                _LOGGER.debug("No numeric sensor value for command 0x%02X (data: %r)",
+                              command, raw_data)
             else:
                 _LOGGER.debug("No data in response for sensor command 0x%02X", command)
         else:
             _LOGGER.debug("Invalid response for sensor command 0x%02X: %s", command, response)
         return None
 
+    async def get_sensor_values(self, commands: Iterable[int]) -> dict[int, float | None]:
+        """Read several sensor registers, keyed by command.
+
+        The protocol has no ranged read, so the GETs are pipelined on the
+        connection and their responses collected together.
+        """
+        responses = await self.send_pipeline((c, SUB_GET, None) for c in commands)
+        return {c: self._parse_sensor_value(c, r) for c, r in responses.items()}
+
     async def get_temperature(self) -> float | None:
         """Get temperature in Fahrenheit (command 0x50)."""
         return await self._get_sensor_value(0x50)
@@ -488,3 +806,41 @@ class RackLinkProtocol:
     async def get_occupancy(self) -> float | None:
         """Get occupancy status (command 0x56)."""
         return await self._get_sensor_value(0x56)
+
+
+# Packets that never change, built once at import
+_PING_PACKET = RackLinkProtocol.build_packet(bytes((0x00, CMD_PING, SUB_SET)))
+_PONG_PACKET = RackLinkProtocol.build_packet(bytes((0x00, CMD_PING, SUB_RESPONSE)))
+# Parameterless GETs: the outlet count and every sensor register
+_GET_PACKETS: dict[int, bytes] = {
+    command: RackLinkProtocol.build_packet(bytes((0x00, command, SUB_GET)))
+    for command in (CMD_OUTLET_COUNT, *range(CMD_SENSORS_START, CMD_SENSORS_END + 1))
+}
+# Per-outlet commands, with the index (and state) bytes zeroed. Only those
+# bytes and the checksum differ between outlets, so they're patched in place
+# rather than escaping and summing the whole envelope again.
+_OUTLET_TEMPLATES: dict[tuple[int, int, int], bytes] = {
+    (command, subcommand, size): RackLinkProtocol.build_packet(
+        bytes((0x00, command, subcommand)) + bytes(size)
+    )
+    for command, subcommand, size in (
+        (CMD_POWER_OUTLETS, SUB_GET, 1),
+        (CMD_POWER_OUTLETS, SUB_SET, 2),
+        (CMD_OUTLET_NAME, SUB_GET, 1),
+    )
+}
+
+
+def _patch_template(command: int, subcommand: int, data: bytes) -> bytes | None:
+    """Fill an outlet template with data, or None if it has no template.
+
+    Falls back (None) when a data byte would need escaping, since that
+    changes the packet length.
+    """
+    template = _OUTLET_TEMPLATES.get((command, subcommand, len(data)))
+    if template is None or max(data) >= PROTOCOL_ESCAPE:
+        return None
+    packet = bytearray(template)
+    packet[5:5 + len(data)] = data
+    packet[-2] = (template[-2] + sum(data)) & 0x7F
+    return bytes(packet)
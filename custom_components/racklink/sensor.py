@@ -7,6 +7,7 @@ from typing import Any
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -17,16 +18,71 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 from .coordinator import RackLinkCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Device sensors; each key is both the coordinator.sensors key and the
+# unique_id suffix
+SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="temperature",
+        name="Temperature",
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:thermometer",
+    ),
+    SensorEntityDescription(
+        key="voltage",
+        name="Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:lightning-bolt",
+    ),
+    SensorEntityDescription(
+        key="current",
+        name="Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:current-ac",
+    ),
+    SensorEntityDescription(
+        key="power",
+        name="Power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:flash",
+    ),
+    SensorEntityDescription(
+        key="power_factor",
+        name="Power Factor",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:sine-wave",
+    ),
+    SensorEntityDescription(
+        key="thermal_load",
+        name="Thermal Load",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:heat-wave",
+    ),
+    SensorEntityDescription(
+        key="occupancy",
+        name="Occupancy",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:motion-sensor",
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -39,16 +95,10 @@ async def async_setup_entry(
     await coordinator.async_config_entry_first_refresh()
 
     # Create sensor entities
-    entities: list[SensorEntity] = [
-        RackLinkConnectionSensor(coordinator),
-        RackLinkTemperatureSensor(coordinator),
-        RackLinkVoltageSensor(coordinator),
-        RackLinkCurrentSensor(coordinator),
-        RackLinkPowerSensor(coordinator),
-        RackLinkPowerFactorSensor(coordinator),
-        RackLinkThermalLoadSensor(coordinator),
-        RackLinkOccupancySensor(coordinator),
-    ]
+    entities: list[SensorEntity] = [RackLinkConnectionSensor(coordinator)]
+    entities.extend(
+        RackLinkSensor(coordinator, description) for description in SENSOR_DESCRIPTIONS
+    )
 
     async_add_entities(entities)
 
@@ -64,16 +114,7 @@ class RackLinkConnectionSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_connection"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=f"RackLink {self.coordinator.client.host}",
-            manufacturer=MANUFACTURER,
-            model="RackLink",
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
@@ -83,205 +124,22 @@ class RackLinkConnectionSensor(CoordinatorEntity, SensorEntity):
         return "Disconnected"
 
 
-class RackLinkTemperatureSensor(CoordinatorEntity, SensorEntity):
-    """Representation of RackLink temperature sensor."""
-
-    _attr_name = "Temperature"
-    _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:thermometer"
+class RackLinkSensor(CoordinatorEntity, SensorEntity):
+    """Representation of a RackLink measurement sensor."""
 
-    def __init__(self, coordinator: RackLinkCoordinator) -> None:
+    def __init__(
+        self,
+        coordinator: RackLinkCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_temperature"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=f"RackLink {self.coordinator.client.host}",
-            manufacturer=MANUFACTURER,
-            model="RackLink",
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the temperature."""
-        return self.coordinator.data.get("sensors", {}).get("temperature")
-
-
-class RackLinkVoltageSensor(CoordinatorEntity, SensorEntity):
-    """Representation of RackLink voltage sensor."""
-
-    _attr_name = "Voltage"
-    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-    _attr_device_class = SensorDeviceClass.VOLTAGE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:lightning-bolt"
-
-    def __init__(self, coordinator: RackLinkCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_voltage"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=f"RackLink {self.coordinator.client.host}",
-            manufacturer=MANUFACTURER,
-            model="RackLink",
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the voltage."""
-        return self.coordinator.data.get("sensors", {}).get("voltage")
-
-
-class RackLinkCurrentSensor(CoordinatorEntity, SensorEntity):
-    """Representation of RackLink current sensor."""
-
-    _attr_name = "Current"
-    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-    _attr_device_class = SensorDeviceClass.CURRENT
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:current-ac"
-
-    def __init__(self, coordinator: RackLinkCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_current"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=f"RackLink {self.coordinator.client.host}",
-            manufacturer=MANUFACTURER,
-            model="RackLink",
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current."""
-        return self.coordinator.data.get("sensors", {}).get("current")
-
-
-class RackLinkPowerSensor(CoordinatorEntity, SensorEntity):
-    """Representation of RackLink power sensor."""
-
-    _attr_name = "Power"
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:flash"
-
-    def __init__(self, coordinator: RackLinkCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_power"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=f"RackLink {self.coordinator.client.host}",
-            manufacturer=MANUFACTURER,
-            model="RackLink",
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the power."""
-        return self.coordinator.data.get("sensors", {}).get("power")
-
-
-class RackLinkPowerFactorSensor(CoordinatorEntity, SensorEntity):
-    """Representation of RackLink power factor sensor."""
-
-    _attr_name = "Power Factor"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:sine-wave"
-
-    def __init__(self, coordinator: RackLinkCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_power_factor"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=f"RackLink {self.coordinator.client.host}",
-            manufacturer=MANUFACTURER,
-            model="RackLink",
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the power factor."""
-        return self.coordinator.data.get("sensors", {}).get("power_factor")
-
-
-class RackLinkThermalLoadSensor(CoordinatorEntity, SensorEntity):
-    """Representation of RackLink thermal load sensor."""
-
-    _attr_name = "Thermal Load"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:heat-wave"
-
-    def __init__(self, coordinator: RackLinkCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_thermal_load"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=f"RackLink {self.coordinator.client.host}",
-            manufacturer=MANUFACTURER,
-            model="RackLink",
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the thermal load."""
-        return self.coordinator.data.get("sensors", {}).get("thermal_load")
-
-
-class RackLinkOccupancySensor(CoordinatorEntity, SensorEntity):
-    """Representation of RackLink occupancy sensor."""
-
-    _attr_name = "Occupancy"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:motion-sensor"
-
-    def __init__(self, coordinator: RackLinkCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_occupancy"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=f"RackLink {self.coordinator.client.host}",
-            manufacturer=MANUFACTURER,
-            model="RackLink",
-        )
+        self.entity_description = description
+        self._key = description.key
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
-        """Return the occupancy."""
-        return self.coordinator.data.get("sensors", {}).get("occupancy")
+        """Return the latest reading."""
+        return self.coordinator.sensors.get(self._key)
@@ -6,16 +6,19 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
-from .coordinator import RackLinkCoordinator
+from .const import DOMAIN
+from .coordinator import Outlet, RackLinkCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds a read or acknowledged state is trusted enough to skip a SET that
+# would not change anything
+STATE_FRESHNESS = 5.0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -30,15 +33,16 @@ async def async_setup_entry(
 
     outlets = coordinator.data.get("outlets", {})
     
-    # Safety: Only create entities for outlets 1-16 maximum
-    entities = [
-        RackLinkOutlet(coordinator, outlet_index, outlet_data)
-        for outlet_index, outlet_data in outlets.items()
+    # Safety: Only create entities for outlets 1-16 maximum. Sorted by index
+    # so entities are added in a stable order.
+    entities = tuple(
+        RackLinkOutlet(coordinator, outlet_index, outlets[outlet_index])
+        for outlet_index in sorted(outlets)
         if 1 <= outlet_index <= 16
-    ]
+    )
     
     _LOGGER.info("Creating %d outlet switch entities (outlets 1-%d)", 
-                len(entities), max([e._outlet_index for e in entities] if entities else [0]))
+                len(entities), entities[-1]._outlet_index if entities else 0)
 
     async_add_entities(entities)
 
@@ -50,61 +54,61 @@ class RackLinkOutlet(CoordinatorEntity, SwitchEntity):
         self,
         coordinator: RackLinkCoordinator,
         outlet_index: int,
-        outlet_data: dict,
+        outlet_data: Outlet,
     ) -> None:
         """Initialize the outlet."""
         super().__init__(coordinator)
         self._outlet_index = outlet_index
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_outlet_{outlet_index}"
-        self._attr_name = outlet_data.get("name", f"Outlet {outlet_index}")
-        self._attr_is_on = outlet_data.get("state", False)
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=f"RackLink {self.coordinator.client.host}",
-            manufacturer=MANUFACTURER,
-            model="RackLink",
+        self._attr_device_info = coordinator.device_info
+        self._attr_name = outlet_data.name
+        self._attr_is_on = outlet_data.state is True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the outlet's state from the latest update."""
+        outlet_data = self.coordinator.data.get("outlets", {}).get(self._outlet_index)
+        # If state is None, report off (unknown state)
+        self._attr_is_on = outlet_data is not None and outlet_data.state is True
+        super()._handle_coordinator_update()
+
+    def _already(self, state: bool) -> bool:
+        """Return True if the outlet was recently seen in ``state``."""
+        outlet_data = self.coordinator.data.get("outlets", {}).get(self._outlet_index)
+        return (
+            outlet_data is not None
+            and outlet_data.state is state
+            # Tracked per outlet: acknowledging a sibling outlet's SET
+            # must not make this outlet's older poll result look fresh
+            and self.coordinator.outlet_state_age(self._outlet_index) < STATE_FRESHNESS
         )
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if outlet is on."""
-        outlet_data = self.coordinator.data.get("outlets", {}).get(self._outlet_index, {})
-        state = outlet_data.get("state")
-        # If state is None, return False (unknown state)
-        return state is True
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the outlet on."""
+        if self._already(True):
+            return
         success = await self.coordinator.client.set_outlet_state(self._outlet_index, True)
         if success:
-            # Update local state immediately
-            if "outlets" not in self.coordinator.data:
-                self.coordinator.data["outlets"] = {}
-            if self._outlet_index not in self.coordinator.data["outlets"]:
-                self.coordinator.data["outlets"][self._outlet_index] = {}
-            self.coordinator.data["outlets"][self._outlet_index]["state"] = True
-            self.async_write_ha_state()
-            # Trigger a refresh to get updated state
-            await self.coordinator.async_request_refresh()
+            # The device acknowledged the change, so the local state is
+            # already correct until the next poll; this updates every entity
+            self.coordinator.async_set_outlet_state(self._outlet_index, True)
         else:
             _LOGGER.error("Failed to turn on outlet %d", self._outlet_index)
+            # The outlet may or may not have switched; re-read it. Toggling
+            # several outlets at once still costs one refresh.
+            self.coordinator.async_schedule_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the outlet off."""
+        if self._already(False):
+            return
         success = await self.coordinator.client.set_outlet_state(self._outlet_index, False)
         if success:
-            # Update local state immediately
-            if "outlets" not in self.coordinator.data:
-                self.coordinator.data["outlets"] = {}
-            if self._outlet_index not in self.coordinator.data["outlets"]:
-                self.coordinator.data["outlets"][self._outlet_index] = {}
-            self.coordinator.data["outlets"][self._outlet_index]["state"] = False
-            self.async_write_ha_state()
-            # Trigger a refresh to get updated state
-            await self.coordinator.async_request_refresh()
+            # The device acknowledged the change, so the local state is
+            # already correct until the next poll; this updates every entity
+            self.coordinator.async_set_outlet_state(self._outlet_index, False)
         else:
             _LOGGER.error("Failed to turn off outlet %d", self._outlet_index)
+            # The outlet may or may not have switched; re-read it. Toggling
+            # several outlets at once still costs one refresh.
+            self.coordinator.async_schedule_refresh()
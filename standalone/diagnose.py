@@ -6,21 +6,12 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from custom_components.racklink.protocol import RackLinkProtocol
-from custom_components.racklink.const import (
-    CMD_POWER_OUTLETS,
-    CMD_OUTLET_NAME,
-    CMD_OUTLET_COUNT,
-    CMD_PING,
-    CMD_NACK,
-    SUB_GET,
-    SUB_SET,
-    SUB_RESPONSE,
-)
-
 
 async def diagnose(host: str, port: int, username: str, password: str):
     """Run diagnostic tests."""
+    from custom_components.racklink.protocol import RackLinkProtocol
+    from custom_components.racklink.const import CMD_POWER_OUTLETS, SUB_GET
+
     print("=" * 60)
     print("RackLink RLNK-SW715R Diagnostic Tool")
     print("=" * 60)
@@ -44,7 +35,7 @@ async def diagnose(host: str, port: int, username: str, password: str):
     print("Test 2: Login")
     print("-" * 60)
     login_str = f"{username}|{password}"
-    data_envelope = [0x00, 0x02, 0x01] + list(login_str.encode("ascii"))
+    data_envelope = bytes((0x00, 0x02, 0x01)) + login_str.encode("ascii")
     packet = client.build_packet(data_envelope)
     print(f"Login packet: {packet.hex(' ').upper()}")
     
@@ -52,16 +43,16 @@ async def diagnose(host: str, port: int, username: str, password: str):
     response = await client.receive_packet(timeout=5.0)
     
     if response:
-        print(f"Response: cmd=0x{response['command']:02X}, sub=0x{response['subcommand']:02X}")
-        print(f"Data: {[hex(b) for b in response['data']]}")
+        print(f"Response: cmd=0x{response.command:02X}, sub=0x{response.subcommand:02X}")
+        print(f"Data: {response.data.hex(' ')}")
         
-        if response["command"] == 0x10:  # NACK
-            error_code = response["data"][0] if response["data"] else 0
+        if response.command == 0x10:  # NACK
+            error_code = response.data[0] if response.data else 0
             print(f"❌ Login NACK, error code: 0x{error_code:02X}")
             await client.disconnect()
             return
-        elif response["command"] == 0x02 and response["subcommand"] == 0x10:
-            if response["data"] and response["data"][0] == 0x01:
+        elif response.command == 0x02 and response.subcommand == 0x10:
+            if response.data and response.data[0] == 0x01:
                 print("✅ Login successful")
             else:
                 print("❌ Login response indicates failure")
@@ -80,16 +71,13 @@ async def diagnose(host: str, port: int, username: str, password: str):
     print("-" * 60)
     ping_response = await client.receive_packet(timeout=5.0)
     if ping_response:
-        print(f"Received: cmd=0x{ping_response['command']:02X}, sub=0x{ping_response['subcommand']:02X}")
-        if ping_response["command"] == 0x01 and ping_response["subcommand"] == 0x01:
+        print(f"Received: cmd=0x{ping_response.command:02X}, sub=0x{ping_response.subcommand:02X}")
+        if ping_response.command == 0x01 and ping_response.subcommand == 0x01:
             print("✅ Device sent ping (SET)")
-            # Respond with pong
-            pong_envelope = [0x00, 0x01, 0x10]
-            pong_packet = client.build_packet(pong_envelope)
-            await client.send_packet(pong_packet)
-            print("✅ Sent pong response")
+            # The client answers device pings as they arrive (see _dispatch)
+            print("✅ Pong response sent by client")
         else:
-            print(f"⚠️  Expected ping, got: cmd=0x{ping_response['command']:02X}")
+            print(f"⚠️  Expected ping, got: cmd=0x{ping_response.command:02X}")
     else:
         print("⚠️  No ping received (may be normal for some devices)")
     print()
@@ -120,13 +108,22 @@ async def diagnose(host: str, port: int, username: str, password: str):
             print(f"Raw response: {response}")
     print()
 
+    # Tests 6 and 7 don't depend on each other, so all their requests go out
+    # together; the results are still printed in order. Without a count
+    # there are no outlets to read and both batches are empty.
+    indices = range(1, min(count + 1, 9)) if count else range(0)  # Test first 8
+    states, names, response = await asyncio.gather(
+        client.get_outlet_states(indices),
+        asyncio.gather(*(client.get_outlet_name(i) for i in indices)),
+        client.send_command(CMD_POWER_OUTLETS, SUB_GET, bytes((1,))),
+    )
+
     # Test 6: Get Outlet States
     print("Test 6: Get Outlet States")
     print("-" * 60)
     if count:
-        for i in range(1, min(count + 1, 9)):  # Test first 8
-            state = await client.get_outlet_state(i)
-            name = await client.get_outlet_name(i)
+        for i, name in zip(indices, names):
+            state = states[i]
             if state is not None:
                 print(f"  Outlet {i}: {name or f'Outlet {i}'} - {'ON' if state else 'OFF'}")
             else:
@@ -136,12 +133,11 @@ async def diagnose(host: str, port: int, username: str, password: str):
     # Test 7: Raw Command Test
     print("Test 7: Raw Command (Get Outlet 1)")
     print("-" * 60)
-    response = await client.send_command(CMD_POWER_OUTLETS, SUB_GET, [1])
     if response:
         print(f"✅ Response: {response}")
-        print(f"   Command: 0x{response['command']:02X}")
-        print(f"   Subcommand: 0x{response['subcommand']:02X}")
-        print(f"   Data: {[hex(b) for b in response['data']]}")
+        print(f"   Command: 0x{response.command:02X}")
+        print(f"   Subcommand: 0x{response.subcommand:02X}")
+        print(f"   Data: {response.data.hex(' ')}")
     else:
         print("❌ No response")
     print()
@@ -2,21 +2,54 @@
 """Standalone RackLink CLI tool for testing protocol without Home Assistant."""
 import argparse
 import asyncio
+import contextlib
+import io
+import json
 import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
 # Add parent directory to path to import protocol
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from custom_components.racklink.protocol import RackLinkProtocol
-from custom_components.racklink.const import (
-    CMD_POWER_OUTLETS,
-    CMD_OUTLET_NAME,
-    CMD_OUTLET_COUNT,
-    CMD_PING,
-    SUB_GET,
-    SUB_SET,
-)
+DEFAULT_SOCKET = "/tmp/racklink.sock"
+# The daemon closes the device session after this long without a command
+DAEMON_IDLE_TIMEOUT = 60.0
+# Outlet names are re-read after this long; renames are rare
+NAME_CACHE_TTL = 300.0
+
+
+async def _read_line(prompt: str) -> str:
+    """Read a line of stdin without blocking the event loop.
+
+    input() runs in a daemon thread rather than the default executor, so a
+    prompt still waiting when the shell is cancelled (Ctrl-C) doesn't keep
+    the interpreter from exiting.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def deliver(line: str | None, err: Exception | None) -> None:
+        if future.done():
+            return
+        if err is not None:
+            future.set_exception(err)
+        else:
+            future.set_result(line)
+
+    def read() -> None:
+        try:
+            line, err = input(prompt), None
+        except Exception as e:  # EOFError, or stdin closed
+            line, err = None, e
+        # The loop may already be gone if the shell was interrupted
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(deliver, line, err)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
 
 
 class RackLinkCLI:
@@ -24,10 +57,24 @@ class RackLinkCLI:
 
     def __init__(self, host: str, port: int, username: str, password: str):
         """Initialize CLI."""
+        # Imported here so a --socket client never loads the integration package
+        from custom_components.racklink.protocol import RackLinkProtocol
+
         self.client = RackLinkProtocol(host, port)
         self.username = username
         self.password = password
         self.connected = False
+        # Outlet index -> (monotonic time fetched, name)
+        self._name_cache: dict[int, tuple[float, str]] = {}
+        # Command name -> (handler, number of arguments it takes)
+        self._dispatch: dict[str, tuple[Callable[..., Awaitable[None]], int]] = {
+            "ping": (self.cmd_ping, 0),
+            "count": (self.cmd_outlet_count, 0),
+            "list": (self.cmd_outlet_list, 0),
+            "get": (lambda i: self.cmd_outlet_get(int(i)), 1),
+            "on": (lambda i: self.cmd_outlet_set(int(i), True), 1),
+            "off": (lambda i: self.cmd_outlet_set(int(i), False), 1),
+        }
 
     async def connect(self) -> bool:
         """Connect and login to device."""
@@ -53,6 +100,17 @@ class RackLinkCLI:
             self.connected = False
             print("Disconnected.")
 
+    async def cached_outlet_name(self, index: int) -> str | None:
+        """Return an outlet's name, reading it from the device once per TTL."""
+        cached = self._name_cache.get(index)
+        now = time.monotonic()
+        if cached and now - cached[0] < NAME_CACHE_TTL:
+            return cached[1]
+        name = await self.client.get_outlet_name(index)
+        if name:
+            self._name_cache[index] = (now, name)
+        return name
+
     async def cmd_ping(self) -> None:
         """Test ping/pong."""
         print("Sending ping...")
@@ -77,11 +135,17 @@ class RackLinkCLI:
             print("❌ Could not get outlet count")
             return
 
+        # Issue every read at once; the client pipelines them on the socket
+        indices = range(1, count + 1)
+        states, names = await asyncio.gather(
+            self.client.get_all_outlet_states(count),
+            asyncio.gather(*(self.cached_outlet_name(i) for i in indices)),
+        )
+
         print(f"\n{'Index':<8} {'Name':<30} {'State':<10}")
         print("-" * 50)
-        for i in range(1, count + 1):
-            state = await self.client.get_outlet_state(i)
-            name = await self.client.get_outlet_name(i)
+        for i, name in zip(indices, names):
+            state = states[i]
             state_str = "ON" if state else "OFF" if state is not None else "UNKNOWN"
             name_str = name or f"Outlet {i}"
             print(f"{i:<8} {name_str:<30} {state_str:<10}")
@@ -90,7 +154,7 @@ class RackLinkCLI:
         """Get outlet state."""
         print(f"Getting state for outlet {index}...")
         state = await self.client.get_outlet_state(index)
-        name = await self.client.get_outlet_name(index)
+        name = await self.cached_outlet_name(index)
         if state is not None:
             state_str = "ON" if state else "OFF"
             name_str = name or f"Outlet {index}"
@@ -110,114 +174,212 @@ class RackLinkCLI:
 
     async def cmd_raw(self, command: int, subcommand: int, data: str = "") -> None:
         """Send raw command."""
-        data_bytes = []
+        data_bytes = b""
         if data:
             # Try to parse as hex first
-            if all(c in "0123456789abcdefABCDEF " for c in data):
-                clean = data.replace(" ", "")
-                for i in range(0, len(clean), 2):
-                    if i + 1 < len(clean):
-                        data_bytes.append(int(clean[i : i + 2], 16))
-            else:
+            try:
+                data_bytes = bytes.fromhex(data.replace(" ", ""))
+            except ValueError:
                 # Treat as ASCII
-                data_bytes = list(data.encode("ascii"))
+                data_bytes = data.encode("ascii")
 
         print(f"Sending command: 0x{command:02X}, subcommand: 0x{subcommand:02X}")
         if data_bytes:
-            print(f"Data: {[hex(b) for b in data_bytes]}")
+            print(f"Data: {data_bytes.hex(' ')}")
 
-        response = await self.client.send_command(command, subcommand, data_bytes if data_bytes else None)
+        # A raw command may have renamed an outlet
+        self._name_cache.clear()
+        response = await self.client.send_command(command, subcommand, data_bytes or None)
         if response:
             print("✅ Response received:")
-            print(f"  Command: 0x{response['command']:02X}")
-            print(f"  Subcommand: 0x{response['subcommand']:02X}")
-            print(f"  Data: {[hex(b) for b in response['data']]}")
-            if response["data"]:
+            print(f"  Command: 0x{response.command:02X}")
+            print(f"  Subcommand: 0x{response.subcommand:02X}")
+            print(f"  Data: {response.data.hex(' ')}")
+            if response.data:
                 try:
-                    ascii_data = bytes(response["data"]).decode("ascii", errors="ignore")
+                    ascii_data = bytes(response.data).decode("ascii", errors="ignore")
                     print(f"  ASCII: {ascii_data}")
                 except:
                     pass
         else:
             print("❌ No response or error")
 
+    async def run_command(self, command: str) -> bool:
+        """Run a single command line; return False if it isn't recognised."""
+        cmd_parts = command.split()
+        cmd = cmd_parts[0].lower() if cmd_parts else ""
+
+        handler, arity = self._dispatch.get(cmd, (None, 0))
+        if handler is None or len(cmd_parts) <= arity:
+            print(f"Unknown command: {command}")
+            print("Available: ping, count, list, get <n>, on <n>, off <n>")
+            return False
+        await handler(*cmd_parts[1 : 1 + arity])
+        return True
+
+    async def serve(self, path: str, idle_timeout: float = DAEMON_IDLE_TIMEOUT) -> None:
+        """Keep one logged-in session and run commands sent to a Unix socket.
+
+        Each client sends one JSON line, {"command": "..."}, and gets back
+        {"ok": ..., "output": "..."}. The session is opened on demand and
+        closed after idle_timeout seconds without a command.
+        """
+        loop = asyncio.get_running_loop()
+        lock = asyncio.Lock()  # commands capture stdout, so run one at a time
+        idle: asyncio.TimerHandle | None = None
+        # The loop only keeps weak references to tasks; hold the idle closes
+        closing: set[asyncio.Task] = set()
+
+        async def close_idle() -> None:
+            async with lock:
+                await self.disconnect()
+
+        def schedule_close() -> None:
+            task = loop.create_task(close_idle())
+            closing.add(task)
+            task.add_done_callback(closing.discard)
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            nonlocal idle
+            try:
+                request = json.loads(await reader.readline())
+                output = io.StringIO()
+                async with lock:
+                    if idle:
+                        idle.cancel()
+                    try:
+                        # Connect inside the redirect so a failed connect or
+                        # login is reported to the client
+                        with contextlib.redirect_stdout(output):
+                            ok = self.client.connected_event.is_set() or await self.connect()
+                            if ok:
+                                ok = await self.run_command(request["command"])
+                    finally:
+                        idle = loop.call_later(idle_timeout, schedule_close)
+                reply = {"ok": ok, "output": output.getvalue()}
+            except Exception as e:
+                reply = {"ok": False, "output": f"Error: {e}\n"}
+            try:
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+            finally:
+                writer.close()
+
+        server = await asyncio.start_unix_server(handle, path)
+        print(f"Serving on {path} (idle timeout {idle_timeout:.0f}s)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if idle:
+                idle.cancel()
+            await self.disconnect()
+            Path(path).unlink(missing_ok=True)
+
     async def interactive_shell(self) -> None:
         """Run interactive shell."""
         if not await self.connect():
             return
 
-        print("\n" + "=" * 60)
-        print("RackLink Interactive Shell")
-        print("=" * 60)
-        print("Commands:")
-        print("  ping                    - Test ping/pong")
-        print("  count                   - Get outlet count")
-        print("  list                    - List all outlets")
-        print("  get <index>             - Get outlet state")
-        print("  on <index>              - Turn outlet ON")
-        print("  off <index>             - Turn outlet OFF")
-        print("  raw <cmd> <sub> [data]  - Send raw command (hex)")
-        print("  help                    - Show this help")
-        print("  quit/exit               - Exit")
-        print("=" * 60 + "\n")
-
-        while self.connected:
-            try:
-                line = input("racklink> ").strip()
-                if not line:
-                    continue
+        # The banner is for people; skip it when commands are piped in
+        if sys.stdin.isatty():
+            print("\n" + "=" * 60)
+            print("RackLink Interactive Shell")
+            print("=" * 60)
+            print("Commands:")
+            print("  ping                    - Test ping/pong")
+            print("  count                   - Get outlet count")
+            print("  list                    - List all outlets")
+            print("  get <index>             - Get outlet state")
+            print("  on <index>              - Turn outlet ON")
+            print("  off <index>             - Turn outlet OFF")
+            print("  raw <cmd> <sub> [data]  - Send raw command (hex)")
+            print("  help                    - Show this help")
+            print("  quit/exit               - Exit")
+            print("=" * 60 + "\n")
 
-                parts = line.split()
-                cmd = parts[0].lower()
-
-                if cmd in ("quit", "exit", "q"):
+        try:
+            while self.connected:
+                try:
+                    # Read off the loop so it keeps answering device pings
+                    # while the prompt waits
+                    line = (await _read_line("racklink> ")).strip()
+                    if not line:
+                        continue
+
+                    parts = line.split()
+                    cmd = parts[0].lower()
+
+                    handler, arity = self._dispatch.get(cmd, (None, 0))
+
+                    if cmd in ("quit", "exit", "q"):
+                        break
+                    elif cmd == "help":
+                        print("Commands: ping, count, list, get <n>, on <n>, off <n>, raw <cmd> <sub> [data], quit")
+                    elif handler and len(parts) > arity:
+                        await handler(*parts[1 : 1 + arity])
+                    elif cmd == "raw" and len(parts) >= 3:
+                        cmd_byte = int(parts[1], 16) if parts[1].startswith("0x") else int(parts[1], 16)
+                        sub_byte = int(parts[2], 16) if parts[2].startswith("0x") else int(parts[2], 16)
+                        data = " ".join(parts[3:]) if len(parts) > 3 else ""
+                        await self.cmd_raw(cmd_byte, sub_byte, data)
+                    else:
+                        print("Unknown command. Type 'help' for help.")
+
+                except EOFError:
+                    print()
                     break
-                elif cmd == "help":
-                    print("Commands: ping, count, list, get <n>, on <n>, off <n>, raw <cmd> <sub> [data], quit")
-                elif cmd == "ping":
-                    await self.cmd_ping()
-                elif cmd == "count":
-                    await self.cmd_outlet_count()
-                elif cmd == "list":
-                    await self.cmd_outlet_list()
-                elif cmd == "get" and len(parts) > 1:
-                    await self.cmd_outlet_get(int(parts[1]))
-                elif cmd == "on" and len(parts) > 1:
-                    await self.cmd_outlet_set(int(parts[1]), True)
-                elif cmd == "off" and len(parts) > 1:
-                    await self.cmd_outlet_set(int(parts[1]), False)
-                elif cmd == "raw" and len(parts) >= 3:
-                    cmd_byte = int(parts[1], 16) if parts[1].startswith("0x") else int(parts[1], 16)
-                    sub_byte = int(parts[2], 16) if parts[2].startswith("0x") else int(parts[2], 16)
-                    data = " ".join(parts[3:]) if len(parts) > 3 else ""
-                    await self.cmd_raw(cmd_byte, sub_byte, data)
-                else:
-                    print("Unknown command. Type 'help' for help.")
-
-            except KeyboardInterrupt:
-                print("\nInterrupted.")
-                break
-            except Exception as e:
-                print(f"Error: {e}")
+                except Exception as e:
+                    print(f"Error: {e}")
+        finally:
+            # Also runs when Ctrl-C cancels the shell mid-prompt
+            await self.disconnect()
+
 
-        await self.disconnect()
+async def send_to_daemon(path: str, command: str) -> bool:
+    """Run a command through a daemon's socket and print its output."""
+    reader, writer = await asyncio.open_unix_connection(path)
+    try:
+        writer.write(json.dumps({"command": command}).encode() + b"\n")
+        await writer.drain()
+        reply = json.loads(await reader.readline())
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    print(reply["output"], end="")
+    return reply["ok"]
 
 
 async def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="RackLink Protocol CLI Tool")
-    parser.add_argument("host", help="RackLink device IP address")
+    parser.add_argument("host", nargs="?", help="RackLink device IP address (not needed with --socket)")
     parser.add_argument("-p", "--port", type=int, default=60000, help="TCP port (default: 60000)")
     parser.add_argument("-u", "--username", default="user", help="Username (default: user)")
-    parser.add_argument("-P", "--password", required=True, help="Password")
+    parser.add_argument("-P", "--password", help="Password (required unless using --socket)")
     parser.add_argument("-c", "--command", help="Single command to execute (ping, count, list, get <n>, on <n>, off <n>)")
     parser.add_argument("--interactive", "-i", action="store_true", help="Run interactive shell")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Keep one session open and serve commands on --socket")
+    parser.add_argument("--socket", help=f"Daemon Unix socket (default with --daemon: {DEFAULT_SOCKET})")
 
     args = parser.parse_args()
 
+    if args.socket and not args.daemon:
+        # Client of a running daemon: no connect or login of our own
+        if not args.command:
+            parser.error("--socket requires -c/--command")
+        if not await send_to_daemon(args.socket, args.command):
+            sys.exit(1)
+        return
+    if not args.host or args.password is None:
+        parser.error("host and -P/--password are required")
+
     cli = RackLinkCLI(args.host, args.port, args.username, args.password)
 
-    if args.interactive or not args.command:
+    if args.daemon:
+        await cli.serve(args.socket or DEFAULT_SOCKET)
+    elif args.interactive or not args.command:
         await cli.interactive_shell()
     else:
         # Single command mode
@@ -225,24 +387,7 @@ async def main():
             sys.exit(1)
 
         try:
-            cmd_parts = args.command.split()
-            cmd = cmd_parts[0].lower()
-
-            if cmd == "ping":
-                await cli.cmd_ping()
-            elif cmd == "count":
-                await cli.cmd_outlet_count()
-            elif cmd == "list":
-                await cli.cmd_outlet_list()
-            elif cmd == "get" and len(cmd_parts) > 1:
-                await cli.cmd_outlet_get(int(cmd_parts[1]))
-            elif cmd == "on" and len(cmd_parts) > 1:
-                await cli.cmd_outlet_set(int(cmd_parts[1]), True)
-            elif cmd == "off" and len(cmd_parts) > 1:
-                await cli.cmd_outlet_set(int(cmd_parts[1]), False)
-            else:
-                print(f"Unknown command: {args.command}")
-                print("Available: ping, count, list, get <n>, on <n>, off <n>")
+            if not await cli.run_command(args.command):
                 sys.exit(1)
         finally:
             await cli.disconnect()
@@ -15,23 +15,26 @@ from custom_components.racklink.const import (
     PROTOCOL_TAIL,
 )
 
+# Building and parsing never touch the connection, so one client serves all
+_CLIENT = RackLinkProtocol("127.0.0.1")
+
 
 def test_outlet_count_packet():
     """Test outlet count GET packet format per protocol manual."""
-    client = RackLinkProtocol("127.0.0.1")
+    client = _CLIENT
     
     # Per protocol manual: Outlet Count GET
     # Data envelope: [0x00, 0x22, 0x02]
     # 0x00 = destination
     # 0x22 = CMD_OUTLET_COUNT
     # 0x02 = SUB_GET
-    data_envelope = [0x00, CMD_OUTLET_COUNT, SUB_GET]
+    data_envelope = bytes([0x00, CMD_OUTLET_COUNT, SUB_GET])
     packet = client.build_packet(data_envelope)
     
     print("=" * 60)
     print("Outlet Count GET Packet")
     print("=" * 60)
-    print(f"Data envelope: {[hex(b) for b in data_envelope]}")
+    print(f"Data envelope: {data_envelope.hex(' ')}")
     print(f"Full packet: {packet.hex(' ').upper()}")
     print(f"Expected format: FE [length] 00 22 02 [checksum] FF")
     print()
@@ -45,11 +48,11 @@ def test_outlet_count_packet():
     parsed = client.parse_packet(packet)
     if parsed:
         print("Parsed back:")
-        print(f"  Destination: 0x{parsed['destination']:02X}")
-        print(f"  Command: 0x{parsed['command']:02X} (should be 0x22)")
-        print(f"  Subcommand: 0x{parsed['subcommand']:02X} (should be 0x02)")
-        assert parsed['command'] == CMD_OUTLET_COUNT
-        assert parsed['subcommand'] == SUB_GET
+        print(f"  Destination: 0x{parsed.destination:02X}")
+        print(f"  Command: 0x{parsed.command:02X} (should be 0x22)")
+        print(f"  Subcommand: 0x{parsed.subcommand:02X} (should be 0x02)")
+        assert parsed.command == CMD_OUTLET_COUNT
+        assert parsed.subcommand == SUB_GET
         print("✅ Packet format correct")
     else:
         print("❌ Failed to parse packet")
@@ -60,7 +63,7 @@ def test_outlet_count_packet():
 
 def test_outlet_name_packet():
     """Test outlet name GET packet format per protocol manual."""
-    client = RackLinkProtocol("127.0.0.1")
+    client = _CLIENT
     
     # Per protocol manual: Outlet Name GET for outlet 1
     # Data envelope: [0x00, 0x21, 0x02, 0x01]
@@ -69,13 +72,13 @@ def test_outlet_name_packet():
     # 0x02 = SUB_GET
     # 0x01 = outlet index (1)
     outlet_index = 1
-    data_envelope = [0x00, CMD_OUTLET_NAME, SUB_GET, outlet_index]
+    data_envelope = bytes([0x00, CMD_OUTLET_NAME, SUB_GET, outlet_index])
     packet = client.build_packet(data_envelope)
     
     print("=" * 60)
     print("Outlet Name GET Packet (Outlet 1)")
     print("=" * 60)
-    print(f"Data envelope: {[hex(b) for b in data_envelope]}")
+    print(f"Data envelope: {data_envelope.hex(' ')}")
     print(f"Full packet: {packet.hex(' ').upper()}")
     print(f"Expected format: FE [length] 00 21 02 01 [checksum] FF")
     print()
@@ -83,13 +86,13 @@ def test_outlet_name_packet():
     parsed = client.parse_packet(packet)
     if parsed:
         print("Parsed back:")
-        print(f"  Destination: 0x{parsed['destination']:02X}")
-        print(f"  Command: 0x{parsed['command']:02X} (should be 0x21)")
-        print(f"  Subcommand: 0x{parsed['subcommand']:02X} (should be 0x02)")
-        print(f"  Data: {[hex(b) for b in parsed['data']]} (should be [0x01])")
-        assert parsed['command'] == CMD_OUTLET_NAME
-        assert parsed['subcommand'] == SUB_GET
-        assert parsed['data'] == [outlet_index]
+        print(f"  Destination: 0x{parsed.destination:02X}")
+        print(f"  Command: 0x{parsed.command:02X} (should be 0x21)")
+        print(f"  Subcommand: 0x{parsed.subcommand:02X} (should be 0x02)")
+        print(f"  Data: {parsed.data.hex(' ')} (should be 01)")
+        assert parsed.command == CMD_OUTLET_NAME
+        assert parsed.subcommand == SUB_GET
+        assert parsed.data == bytes([outlet_index])
         print("✅ Packet format correct")
     else:
         print("❌ Failed to parse packet")
@@ -100,7 +103,7 @@ def test_outlet_name_packet():
 
 def test_power_outlet_get_packet():
     """Test power outlet GET packet format per protocol manual."""
-    client = RackLinkProtocol("127.0.0.1")
+    client = _CLIENT
     
     # Per protocol manual: Power Outlet GET for outlet 1
     # Data envelope: [0x00, 0x20, 0x02, 0x01]
@@ -109,13 +112,13 @@ def test_power_outlet_get_packet():
     # 0x02 = SUB_GET
     # 0x01 = outlet index (1)
     outlet_index = 1
-    data_envelope = [0x00, CMD_POWER_OUTLETS, SUB_GET, outlet_index]
+    data_envelope = bytes([0x00, CMD_POWER_OUTLETS, SUB_GET, outlet_index])
     packet = client.build_packet(data_envelope)
     
     print("=" * 60)
     print("Power Outlet GET Packet (Outlet 1)")
     print("=" * 60)
-    print(f"Data envelope: {[hex(b) for b in data_envelope]}")
+    print(f"Data envelope: {data_envelope.hex(' ')}")
     print(f"Full packet: {packet.hex(' ').upper()}")
     print(f"Expected format: FE [length] 00 20 02 01 [checksum] FF")
     print()
@@ -123,13 +126,13 @@ def test_power_outlet_get_packet():
     parsed = client.parse_packet(packet)
     if parsed:
         print("Parsed back:")
-        print(f"  Destination: 0x{parsed['destination']:02X}")
-        print(f"  Command: 0x{parsed['command']:02X} (should be 0x20)")
-        print(f"  Subcommand: 0x{parsed['subcommand']:02X} (should be 0x02)")
-        print(f"  Data: {[hex(b) for b in parsed['data']]} (should be [0x01])")
-        assert parsed['command'] == CMD_POWER_OUTLETS
-        assert parsed['subcommand'] == SUB_GET
-        assert parsed['data'] == [outlet_index]
+        print(f"  Destination: 0x{parsed.destination:02X}")
+        print(f"  Command: 0x{parsed.command:02X} (should be 0x20)")
+        print(f"  Subcommand: 0x{parsed.subcommand:02X} (should be 0x02)")
+        print(f"  Data: {parsed.data.hex(' ')} (should be 01)")
+        assert parsed.command == CMD_POWER_OUTLETS
+        assert parsed.subcommand == SUB_GET
+        assert parsed.data == bytes([outlet_index])
         print("✅ Packet format correct")
     else:
         print("❌ Failed to parse packet")
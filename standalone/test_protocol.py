@@ -1,28 +1,38 @@
 #!/usr/bin/env python3
 """Unit tests for RackLink protocol implementation."""
+import asyncio
+import contextlib
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from custom_components.racklink.protocol import RackLinkProtocol
+from custom_components.racklink.protocol import ParsedPacket, RackLinkProtocol
 from custom_components.racklink.const import (
     PROTOCOL_HEADER,
     PROTOCOL_TAIL,
     PROTOCOL_ESCAPE,
+    CMD_NACK,
+    CMD_OUTLET_COUNT,
+    CMD_PING,
+    SUB_GET,
+    SUB_RESPONSE,
 )
 
+# Building and parsing never touch the connection, so one client serves all
+_CLIENT = RackLinkProtocol("127.0.0.1")
+
 
 def test_checksum():
     """Test checksum calculation."""
-    client = RackLinkProtocol("127.0.0.1")
+    client = _CLIENT
     
     # Example from protocol manual: Login packet
     # 0xfe 0x10 0x00 0x02 0x01 "user|password" 0x3F 0xff
     header = PROTOCOL_HEADER
     length = 0x10
-    data_envelope = [0x00, 0x02, 0x01] + list(b"user|password")
+    data_envelope = bytes([0x00, 0x02, 0x01]) + b"user|password"
     
     checksum = client._calculate_checksum(header, length, data_envelope)
     print(f"Checksum test: 0x{checksum:02X} (expected: 0x3F)")
@@ -32,27 +42,36 @@ def test_checksum():
 
 def test_escape():
     """Test escape/unescape functionality."""
-    client = RackLinkProtocol("127.0.0.1")
+    client = _CLIENT
     
     # Test escaping protected values
-    data = [0xFE, 0x00, 0xFF, 0x01, 0xFD, 0x02]
-    escaped = client._escape_data(data)
-    unescaped = client._unescape_data(escaped)
+    data = bytes([0xFE, 0x00, 0xFF, 0x01, 0xFD, 0x02])
+    escaped, escaped_sum = client._escape_data(data)
+    unescaped, unescaped_sum = client._unescape_data(escaped)
     
-    print(f"Original: {[hex(b) for b in data]}")
-    print(f"Escaped:  {[hex(b) for b in escaped]}")
-    print(f"Unescaped: {[hex(b) for b in unescaped]}")
+    print(f"Original: {data.hex(' ')}")
+    print(f"Escaped:  {escaped.hex(' ')}")
+    print(f"Unescaped: {unescaped.hex(' ')}")
     
+    assert escaped == bytes([0xFD, 0x01, 0x00, 0xFD, 0x00, 0x01, 0xFD, 0x02, 0x02]), \
+        "Escaped bytes don't match protocol manual"
     assert unescaped == data, "Escape/unescape failed"
+    assert escaped_sum == unescaped_sum == sum(data), "Envelope sums should match"
+
+    # Round trips, with and without protected bytes, compared as whole bytes
+    for case in (b"", bytes([0x00, 0x20, 0x02, 0x01]), bytes(range(256))):
+        escaped, _ = client._escape_data(case)
+        assert client._unescape_data(bytes(escaped)) == (case, sum(case)), \
+            f"Round trip failed for {case.hex(' ')}"
     print("✅ Escape/unescape correct")
 
 
 def test_packet_build():
     """Test packet building."""
-    client = RackLinkProtocol("127.0.0.1")
+    client = _CLIENT
     
     # Build a simple ping packet
-    data_envelope = [0x00, 0x01, 0x01]  # dest=0x00, cmd=PING, sub=SET
+    data_envelope = bytes([0x00, 0x01, 0x01])  # dest=0x00, cmd=PING, sub=SET
     packet = client.build_packet(data_envelope)
     
     print(f"Built packet: {packet.hex(' ').upper()}")
@@ -67,29 +86,29 @@ def test_packet_build():
 
 def test_packet_parse():
     """Test packet parsing."""
-    client = RackLinkProtocol("127.0.0.1")
+    client = _CLIENT
     
     # Build and parse a packet
-    data_envelope = [0x00, 0x01, 0x10]  # dest=0x00, cmd=PING, sub=RESPONSE
+    data_envelope = bytes([0x00, 0x01, 0x10])  # dest=0x00, cmd=PING, sub=RESPONSE
     packet = client.build_packet(data_envelope)
     parsed = client.parse_packet(packet)
     
     print(f"Parsed packet: {parsed}")
     
     assert parsed is not None, "Failed to parse packet"
-    assert parsed["command"] == 0x01, "Command mismatch"
-    assert parsed["subcommand"] == 0x10, "Subcommand mismatch"
+    assert parsed.command == 0x01, "Command mismatch"
+    assert parsed.subcommand == 0x10, "Subcommand mismatch"
     
     print("✅ Packet parsing correct")
 
 
 def test_login_packet():
     """Test login packet construction."""
-    client = RackLinkProtocol("127.0.0.1")
+    client = _CLIENT
     
     # Build login packet: "user|password"
     login_str = "user|password"
-    data_envelope = [0x00, 0x02, 0x01] + list(login_str.encode("ascii"))
+    data_envelope = bytes([0x00, 0x02, 0x01]) + login_str.encode("ascii")
     packet = client.build_packet(data_envelope)
     
     print(f"Login packet: {packet.hex(' ').upper()}")
@@ -97,16 +116,67 @@ def test_login_packet():
     # Parse it back
     parsed = client.parse_packet(packet)
     assert parsed is not None, "Failed to parse login packet"
-    assert parsed["command"] == 0x02, "Not a login command"
+    assert parsed.command == 0x02, "Not a login command"
     
     # Extract login string
-    login_bytes = parsed["data"]
-    login_reconstructed = bytes(login_bytes).decode("ascii")
+    login_bytes = parsed.data
+    login_reconstructed = login_bytes.decode("ascii")
     assert login_reconstructed == login_str, "Login string mismatch"
     
     print(f"✅ Login packet: {login_reconstructed}")
 
 
+
+def test_sensor_parse():
+    """Test sensor value extraction from ASCII responses."""
+    client = _CLIENT
+    
+    cases = {
+        b"120.5": 120.5,
+        b" 118 ,\x00": 118.0,
+        b"-3,": -3.0,
+        b"": None,
+        b"n/a": None,
+    }
+    for raw, expected in cases.items():
+        response = ParsedPacket(0x00, 0x51, 0x10, raw)
+        value = client._parse_sensor_value(0x51, response)
+        print(f"Sensor data {raw!r}: {value}")
+        assert value == expected, f"Parsed {raw!r} as {value}, expected {expected}"
+    
+    print("✅ Sensor parsing correct")
+
+
+def test_nack_after_ignored_ping():
+    """Test a NACK reaches the request it answers, not an ignored ping."""
+    nack = RackLinkProtocol.build_packet(bytes([0x00, CMD_NACK, SUB_RESPONSE, 0x04]))
+
+    async def device(reader, writer):
+        # Ignore pings, as many units do; NACK everything else
+        with contextlib.suppress(asyncio.IncompleteReadError):
+            while True:
+                header = await reader.readexactly(2)
+                packet = header + await reader.readexactly(header[1] + 2)
+                if _CLIENT.parse_packet(packet).command != CMD_PING:
+                    writer.write(nack)
+
+    async def run():
+        server = await asyncio.start_server(device, "127.0.0.1", 0)
+        client = RackLinkProtocol("127.0.0.1", server.sockets[0].getsockname()[1])
+        try:
+            assert await client.connect(), "Could not connect to test server"
+            await client.ping_send()
+            # A NACK swallowed by the ping would leave this waiting 5 s
+            async with asyncio.timeout(2.0):
+                return await client.send_command(CMD_OUTLET_COUNT, SUB_GET)
+        finally:
+            await client.disconnect()
+            server.close()
+
+    response = asyncio.run(run())
+    assert response is None, "NACK was not reported as a failed command"
+    print("✅ NACK matched past the ignored ping")
+
 if __name__ == "__main__":
     print("Running RackLink Protocol Tests\n")
     print("=" * 50)
@@ -122,6 +192,10 @@ if __name__ == "__main__":
         print()
         test_login_packet()
         print()
+        test_sensor_parse()
+        print()
+        test_nack_after_ignored_ping()
+        print()
         print("=" * 50)
         print("✅ All tests passed!")
     except AssertionError as e: